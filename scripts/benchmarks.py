@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the OADP report scripts, run against synthetic data.
+
+No network access or credentials are needed.
+
+Usage:
+    python3 scripts/benchmarks.py adf        # ADF description text extraction
+    python3 scripts/benchmarks.py render     # cross-reference index and report rendering
+    python3 scripts/benchmarks.py bugs       # get_oadp_bugs.py grouping and rendering
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from collections import defaultdict
+
+import get_oadp_bugs
+from generate_oadp_report import GITHUB_REFERENCES, GitHubIssue, GitHubReferenceIndex, JiraGitHubReporter, JiraIssue
+
+
+def best_of(func, repeat=5, number=1):
+    """Best wall-clock time of func in seconds"""
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+# --- ADF text extraction -----------------------------------------------------
+
+def _recursive_adf_text(node) -> str:
+    """The previous recursive extractor, kept as the benchmark baseline"""
+    if isinstance(node, str):
+        return node
+    if not isinstance(node, dict):
+        return ''
+    parts = []
+    if node.get('type') == 'text':
+        text = node.get('text', '')
+        for mark in node.get('marks', []):
+            if mark.get('type') == 'link':
+                href = mark.get('attrs', {}).get('href', '')
+                if href:
+                    parts.append(href)
+        parts.append(text)
+    for child in node.get('content', []):
+        parts.append(_recursive_adf_text(child))
+    return ' '.join(parts)
+
+
+def _adf_paragraph(i):
+    return {'type': 'paragraph', 'content': [
+        {'type': 'text', 'text': f'Step {i}: the restore hangs after PodVolumeRestore completes, see '},
+        {'type': 'text', 'text': 'upstream',
+         'marks': [{'type': 'link', 'attrs': {'href': f'https://github.com/vmware-tanzu/velero/issues/{8000 + i}'}}]},
+    ]}
+
+
+def build_adf(paragraphs: int, table_rows: int = 0, nesting: int = 0) -> dict:
+    """Synthetic ADF document with paragraphs, a table, and optionally deeply nested lists"""
+    content = [_adf_paragraph(i) for i in range(paragraphs)]
+    if table_rows:
+        content.append({'type': 'table', 'content': [
+            {'type': 'tableRow', 'content': [
+                {'type': 'tableCell', 'content': [_adf_paragraph(row * 4 + col)]} for col in range(4)
+            ]} for row in range(table_rows)
+        ]})
+    if nesting:
+        node = _adf_paragraph(nesting)
+        for _ in range(nesting):
+            node = {'type': 'bulletList', 'content': [{'type': 'listItem', 'content': [node]}]}
+        content.append(node)
+    return {'type': 'doc', 'version': 1, 'content': content}
+
+
+def bench_adf(args) -> None:
+    documents = [
+        ('100 paragraphs', build_adf(100)),
+        ('2k paragraphs + 500-row table', build_adf(2000, table_rows=500)),
+        ('20k paragraphs + 5k-row table', build_adf(20000, table_rows=5000)),
+        (f'{args.depth}-level nested list', build_adf(10, nesting=args.depth)),
+    ]
+
+    print(f"{'document':<34} {'recursive':>12} {'iterative':>12}")
+    for name, doc in documents:
+        new_text = JiraGitHubReporter._extract_text_from_adf(doc)
+        try:
+            old_text = _recursive_adf_text(doc)
+            assert GITHUB_REFERENCES.find(old_text) == GITHUB_REFERENCES.find(new_text)
+            old = f"{best_of(lambda: _recursive_adf_text(doc)) * 1000:10.2f}ms"
+        except RecursionError:
+            old = 'RecursionError'.rjust(12)
+        new = best_of(lambda: JiraGitHubReporter._extract_text_from_adf(doc))
+        print(f"{name:<34} {old:>12} {new * 1000:10.2f}ms")
+
+
+# --- Report rendering ----------------------------------------------------------
+
+def _nested_loop_references(issues, milestones):
+    """The previous per-section lookups, kept as the benchmark baseline"""
+    milestone_github_numbers = {issue.number for milestone_issues in milestones for issue in milestone_issues}
+    issues_in_milestone = set()
+    for oadp_issue in issues:
+        for gh_issue in oadp_issue.github_issues:
+            if gh_issue.number in milestone_github_numbers:
+                issues_in_milestone.add(oadp_issue.key)
+                break
+
+    cells = []
+    for milestone_issues in milestones:
+        # Each section rebuilt its own map
+        github_to_oadp = {}
+        for oadp_issue in issues:
+            for gh_issue in oadp_issue.github_issues:
+                if gh_issue.number not in github_to_oadp:
+                    github_to_oadp[gh_issue.number] = []
+                github_to_oadp[gh_issue.number].append(oadp_issue)
+
+        for milestone_issue in milestone_issues:
+            if milestone_issue.number in github_to_oadp:
+                oadp_parts = []
+                assignee_parts = []
+                for oadp_issue in github_to_oadp[milestone_issue.number]:
+                    oadp_parts.append(f"[{oadp_issue.key}]({oadp_issue.url})")
+                    assignee_parts.append(oadp_issue.assignee)
+                unique_assignees = []
+                seen = set()
+                for assignee in assignee_parts:
+                    if assignee not in seen:
+                        unique_assignees.append(assignee)
+                        seen.add(assignee)
+                cells.append(("<br>".join(oadp_parts), "<br>".join(unique_assignees)))
+    return issues_in_milestone, cells
+
+
+def _indexed_references(issues, milestones):
+    references = GitHubReferenceIndex(issues)
+    issues_in_milestone = references.referencing_keys(
+        issue.number for milestone_issues in milestones for issue in milestone_issues
+    )
+    cells = []
+    for milestone_issues in milestones:
+        for milestone_issue in milestone_issues:
+            reference = references.get(milestone_issue.number)
+            if reference:
+                cells.append(("<br>".join(reference.links), "<br>".join(reference.assignees)))
+    return issues_in_milestone, cells
+
+
+def _github_issue(number):
+    state = 'closed' if number % 3 == 0 else 'open'
+    return GitHubIssue(number=number, title=f'Upstream issue {number}', state=state,
+                       labels=[f'area/{number % 7}', 'kind/bug'][:number % 3],
+                       url=f'https://github.com/vmware-tanzu/velero/issues/{number}')
+
+
+def build_report_data(issue_count: int, milestone_count: int, milestone_size: int, seed: int = 0):
+    """Synthetic OADP issues referencing 0-3 upstream issues each, plus the issues of each milestone"""
+    rng = random.Random(seed)
+    upstream = [_github_issue(8000 + n) for n in range(max(issue_count // 2, milestone_count * milestone_size))]
+    issues = [
+        JiraIssue(key=f'OADP-{1000 + i}', summary=f'Synthetic issue {i}', status='New', priority='Major',
+                  issue_type='Bug', assignee=f'Dev {rng.randrange(40)}',
+                  github_issues=rng.sample(upstream, rng.randrange(4)),
+                  url=f'https://redhat.atlassian.net/browse/OADP-{1000 + i}')
+        for i in range(issue_count)
+    ]
+    milestones = [upstream[m * milestone_size:(m + 1) * milestone_size] for m in range(milestone_count)]
+    return issues, milestones
+
+
+def bench_render(args) -> None:
+    reporter = JiraGitHubReporter('bench@example.com', 'bench-token')
+
+    print(f"{'issues':>8} {'milestones':>11} {'nested loops':>14} {'index':>12} {'full render':>13}")
+    for issue_count in args.issues:
+        for milestone_count in args.milestones:
+            issues, milestones = build_report_data(issue_count, milestone_count, args.milestone_size)
+            sections = {f'v1.{18 - m}': milestone_issues for m, milestone_issues in enumerate(milestones)}
+            assert _nested_loop_references(issues, milestones) == _indexed_references(issues, milestones)
+            old = best_of(lambda: _nested_loop_references(issues, milestones))
+            new = best_of(lambda: _indexed_references(issues, milestones))
+            render = best_of(lambda: list(reporter._generate_markdown(issues, 'project = OADP', sections)), repeat=3)
+            print(f"{issue_count:>8} {milestone_count:>4} x {args.milestone_size:<4} {old * 1000:12.2f}ms "
+                  f"{new * 1000:10.2f}ms {render * 1000:11.2f}ms")
+
+
+# --- Bug report grouping -------------------------------------------------------
+
+def _three_pass_grouping(issues, group_by):
+    """The previous grouping in get_oadp_bugs.iter_markdown, kept as the benchmark baseline"""
+    by_type = defaultdict(list)
+    for issue in issues:
+        itype = issue["fields"].get("issuetype", {}).get("name", "Other")
+        by_type[itype].append(issue)
+
+    all_contacts = set()
+    for issue in issues:
+        all_contacts.add(get_oadp_bugs.get_contact_name(issue, group_by))
+
+    by_person = defaultdict(lambda: defaultdict(list))
+    for issue in issues:
+        name = get_oadp_bugs.get_contact_name(issue, group_by)
+        itype = issue["fields"].get("issuetype", {}).get("name", "Other")
+        by_person[name][itype].append(issue)
+
+    for types in by_person.values():
+        for type_issues in types.values():
+            type_issues.sort(key=lambda i: (
+                get_oadp_bugs.PRIORITY_ORDER.get(i["fields"].get("priority", {}).get("name", "Undefined"), 99),
+                i["fields"]["created"],
+            ))
+    return by_type, all_contacts, by_person
+
+
+def build_bug_issues(issue_count: int, seed: int = 0):
+    """Synthetic Jira search results shaped like the fields get_oadp_bugs.py requests"""
+    rng = random.Random(seed)
+    priorities = list(get_oadp_bugs.PRIORITY_ORDER)
+    issues = []
+    for i in range(issue_count):
+        fields = {
+            "summary": f"Synthetic issue {i}",
+            "status": {"name": rng.choice(["New", "To Do", "In Progress", "ON_QA"])},
+            "priority": {"name": rng.choice(priorities)},
+            "created": f"2025-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}T10:00:00.000+0000",
+            "labels": ["triage", "upstream", "ux"][:rng.randrange(4)],
+            "assignee": {"displayName": f"Dev {rng.randrange(40)}"} if rng.randrange(10) else None,
+            "issuetype": {"name": rng.choice(get_oadp_bugs.ISSUE_TYPES)},
+            get_oadp_bugs.QA_CONTACT_FIELD: {"displayName": f"QE {rng.randrange(15)}"} if rng.randrange(5) else None,
+        }
+        issues.append({"key": f"OADP-{1000 + i}", "fields": fields})
+    return issues
+
+
+def bench_bugs(args) -> None:
+    print(f"{'issues':>8} {'mode':>5} {'three passes':>14} {'one pass':>12} {'full render':>13}")
+    for issue_count in args.issues:
+        issues = build_bug_issues(issue_count)
+        for qe_mode in (False, True):
+            group_by = "qa_contact" if qe_mode else "assignee"
+            by_type, contacts, by_person = _three_pass_grouping(issues, group_by)
+            type_counts, records = get_oadp_bugs.group_issues(issues, group_by)
+            assert {t: len(v) for t, v in by_type.items()} == type_counts and contacts == set(records)
+            assert all([i["key"] for i in by_person[name][t]] == [r.key for r in records[name][t]]
+                       for name in records for t in records[name])
+            old = best_of(lambda: _three_pass_grouping(issues, group_by))
+            new = best_of(lambda: get_oadp_bugs.group_issues(issues, group_by))
+            render = best_of(lambda: get_oadp_bugs.generate_markdown("OADP 1.6.0", issues, issue_count, qe_mode),
+                             repeat=3)
+            mode = "qe" if qe_mode else "bugs"
+            print(f"{issue_count:>8} {mode:>5} {old * 1000:12.2f}ms {new * 1000:10.2f}ms {render * 1000:11.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for the OADP report scripts")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    adf = subparsers.add_parser("adf", help="ADF description text extraction")
+    adf.add_argument("--depth", type=int, default=sys.getrecursionlimit() * 2,
+                     help="nesting depth of the deep-list document (default: twice the recursion limit)")
+    adf.set_defaults(func=bench_adf)
+
+    render = subparsers.add_parser("render", help="cross-reference index and report rendering")
+    render.add_argument("--issues", type=int, nargs="+", default=[1000, 10000],
+                        help="OADP issue counts to render (default: 1000 10000)")
+    render.add_argument("--milestones", type=int, nargs="+", default=[1, 3],
+                        help="milestone section counts to render (default: 1 3)")
+    render.add_argument("--milestone-size", type=int, default=1000,
+                        help="number of issues in each synthetic milestone (default: 1000)")
+    render.set_defaults(func=bench_render)
+
+    bugs = subparsers.add_parser("bugs", help="get_oadp_bugs.py grouping and rendering")
+    bugs.add_argument("--issues", type=int, nargs="+", default=[1000, 10000, 50000],
+                      help="Jira issue counts to group (default: 1000 10000 50000)")
+    bugs.set_defaults(func=bench_bugs)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,48 @@
 """
 Content checker for OADP Velero Issues markdown file.
 Checks for existing content before adding new rows to prevent duplicates.
+
+The reporter also writes a JSON state file next to the report (row numbers,
+per-row content hashes and fetch timestamps). When it is present and matches
+the report on disk it is loaded instead of parsing the markdown.
 """
 
+import hashlib
+import json
+import os
 import re
-from typing import Dict, List, Set, Tuple, Optional
-from dataclasses import dataclass
+from typing import Dict, Iterable, List, Set, Tuple, Optional
+from dataclasses import dataclass, field
+
+from report_writer import atomic_write_text
+
+# Classification of an issue against the existing report
+NEW = 'new'
+UPDATED = 'updated'
+UNCHANGED = 'unchanged'
+
+STATE_VERSION = 2
+
+
+def state_path(markdown_file_path: str) -> str:
+    """Path of the JSON state file kept next to a report"""
+    root, _ = os.path.splitext(markdown_file_path)
+    return f"{root}.state.json"
+
+
+def content_hash(value) -> str:
+    """Stable short digest of a JSON-serializable value"""
+    encoded = json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()[:16]
+
+
+def file_digest(path: str) -> str:
+    """sha256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 @dataclass
@@ -21,46 +58,158 @@ class ParsedRow:
     line_number: int
 
 
-class MarkdownContentChecker:
-    """Checks for existing content in OADP Velero Issues markdown file"""
+@dataclass
+class ReportModel:
+    """A previously rendered OADP Velero issues report, as needed by the next run"""
+    path: str
+    exists: bool = False
+    # Main-table and cross-reference rows in file order
+    rows: List[ParsedRow] = field(default_factory=list)
+    # Jira key -> Row # in the candidate table
+    candidate_rows: Dict[str, int] = field(default_factory=dict)
+    # Velero milestone -> GitHub issue number -> Row # in that milestone's cross-reference table
+    milestone_rows: Dict[str, Dict[int, int]] = field(default_factory=dict)
+    # Where the model came from: 'state', 'markdown' or 'none'
+    source: str = 'none'
+    # Content hash and last-changed timestamp per Jira key / '#<GitHub number>' (state file only)
+    hashes: Dict[str, str] = field(default_factory=dict)
+    changed_at: Dict[str, str] = field(default_factory=dict)
+    fetched_at: Optional[str] = None
+    # Row hash and rendered cells per Jira key / '#<GitHub number>' (state file only)
+    rendered: Dict[str, List] = field(default_factory=dict)
     
-    def __init__(self, markdown_file_path: str):
-        self.markdown_file_path = markdown_file_path
-        self.existing_rows: List[ParsedRow] = []
-        self.jira_to_github_map: Dict[str, Set[int]] = {}
-        
-    def load_existing_content(self) -> None:
-        """Load and parse existing markdown content"""
+    def write_state(self) -> None:
+        """Write the model to the report's state file; call after the report itself is written"""
+        path = state_path(self.path)
+        data = {
+            'version': STATE_VERSION,
+            'fetched_at': self.fetched_at,
+            'report_sha256': file_digest(self.path),
+            'candidate_rows': self.candidate_rows,
+            'milestone_rows': {
+                milestone: {str(number): row for number, row in rows.items()}
+                for milestone, rows in self.milestone_rows.items()
+            },
+            'issues': {
+                row.jira_key: {
+                    'summary': row.jira_summary,
+                    'assignee': row.assignee,
+                    'github_issues': row.github_issues,
+                } for row in self.rows
+            },
+            'hashes': self.hashes,
+            'changed_at': self.changed_at,
+            'rendered': self.rendered,
+        }
+        atomic_write_text(path, json.dumps(data))
+
+
+class ReportParser:
+    """Parses an OADP Velero issues report into a ReportModel in a single streaming pass"""
+    
+    MAIN_HEADERS = (
+        "| Jira Issue | Jira Assignee | Upstream Velero Issue(s) | Upstream Velero Issue Labels |",
+        "| Row # | Jira Issue | Jira Assignee | Upstream Velero Issue(s) | Upstream Velero Issue Labels |",
+    )
+    MILESTONE_HEADING = re.compile(r'^## Velero (.+) Milestone Issues Cross-Reference')
+    CROSS_REF_HEADERS = (
+        "| Velero Issue | Status | Labels | Associated OADP Issue(s) | Jira Assignee |",
+        "| Row # | Velero Issue | Status | Labels | Associated OADP Issue(s) | Jira Assignee |",
+    )
+    
+    def load(self, markdown_file_path: str) -> ReportModel:
+        """Load a report's state file, falling back to parsing the markdown when it is missing or stale"""
+        return self.read_state(markdown_file_path) or self.parse(markdown_file_path)
+    
+    def read_state(self, markdown_file_path: str) -> Optional[ReportModel]:
+        """Model from the state file, or None when it is missing, unreadable or was written for other content"""
         try:
-            with open(self.markdown_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            self._parse_content(content)
-            print(f"Loaded {len(self.existing_rows)} existing rows from {self.markdown_file_path}")
-            
+            with open(state_path(markdown_file_path), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != STATE_VERSION:
+                return None
+            # A hand-edited or regenerated report no longer matches the recorded rows
+            if data.get('report_sha256') != file_digest(markdown_file_path):
+                return None
+            return ReportModel(
+                path=markdown_file_path,
+                exists=True,
+                rows=[
+                    ParsedRow(
+                        jira_key=key,
+                        jira_summary=issue['summary'],
+                        assignee=issue['assignee'],
+                        github_issues=issue['github_issues'],
+                        github_labels='',
+                        raw_content='',
+                        line_number=0
+                    ) for key, issue in data['issues'].items()
+                ],
+                candidate_rows=data['candidate_rows'],
+                milestone_rows={
+                    milestone: {int(number): row for number, row in rows.items()}
+                    for milestone, rows in data['milestone_rows'].items()
+                },
+                source='state',
+                hashes=data['hashes'],
+                changed_at=data['changed_at'],
+                fetched_at=data.get('fetched_at'),
+                rendered=data.get('rendered', {})
+            )
         except FileNotFoundError:
-            print(f"File {self.markdown_file_path} not found. Starting with empty content.")
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Warning: Ignoring unreadable state file {state_path(markdown_file_path)}: {e}")
+            return None
+    
+    def parse(self, markdown_file_path: str) -> ReportModel:
+        """Parse a report file; a missing or unreadable file yields an empty model"""
+        model = ReportModel(path=markdown_file_path)
+        try:
+            with open(markdown_file_path, 'r', encoding='utf-8') as f:
+                model.exists = True
+                model.source = 'markdown'
+                self.parse_lines(f, model)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading content: {e}")
+        return model
     
-    def _parse_content(self, content: str) -> None:
-        """Parse the markdown content to extract existing rows"""
-        lines = content.split('\n')
+    def parse_lines(self, lines: Iterable[str], model: ReportModel) -> ReportModel:
+        """
+        Fill model from report lines.
+        
+        Row numbers come from the first candidate table and from the first
+        cross-reference table under each milestone's heading.
+        """
         in_main_table = False
         in_cross_ref_table = False
+        # Candidate row numbers: None before the table, True inside it, False once it has ended
+        in_candidate_rows = None
+        # Row numbers of the milestone table being read, if it is the first one for its milestone
+        milestone_rows = None
+        milestone = ''
         
         for i, line in enumerate(lines, 1):
+            line = line.rstrip('\n')
+            if line.startswith('## '):
+                # Section heading: names the milestone of the cross-reference table that follows
+                heading = self.MILESTONE_HEADING.match(line)
+                milestone = heading.group(1) if heading else ''
             # Identify main table section - check for both old and new formats
-            if ("| Jira Issue | Jira Assignee | Upstream Velero Issue(s) | Upstream Velero Issue Labels |" in line or
-                "| Row # | Jira Issue | Jira Assignee | Upstream Velero Issue(s) | Upstream Velero Issue Labels |" in line):
+            if any(header in line for header in self.MAIN_HEADERS):
                 in_main_table = True
                 in_cross_ref_table = False
+                if in_candidate_rows is None and self.MAIN_HEADERS[1] in line:
+                    in_candidate_rows = True
                 continue
             # Identify cross-reference table section - check for both old and new formats
-            elif ("| Velero Issue | Status | Labels | Associated OADP Issue(s) | Jira Assignee |" in line or
-                  "| Row # | Velero Issue | Status | Labels | Associated OADP Issue(s) | Jira Assignee |" in line):
+            elif any(header in line for header in self.CROSS_REF_HEADERS):
                 in_main_table = False
                 in_cross_ref_table = True
+                if milestone not in model.milestone_rows and self.CROSS_REF_HEADERS[1] in line:
+                    milestone_rows = model.milestone_rows[milestone] = {}
                 continue
             elif line.startswith('|-------|') or line.startswith('|------------|'):
                 # Skip separator lines for both old and new formats
@@ -69,18 +218,34 @@ class MarkdownContentChecker:
                 # Parse main table row
                 parsed_row = self._parse_main_table_row(line, i)
                 if parsed_row:
-                    self.existing_rows.append(parsed_row)
-                    self._update_mapping(parsed_row)
+                    model.rows.append(parsed_row)
+                if in_candidate_rows:
+                    self._record_row_number(line, r'\[([^]]+)\]', str, model.candidate_rows)
             elif in_cross_ref_table and line.startswith('|') and '|' in line[1:]:
                 # Parse cross-reference table row
                 parsed_row = self._parse_cross_ref_table_row(line, i)
                 if parsed_row:
-                    self.existing_rows.append(parsed_row)
-                    self._update_mapping(parsed_row)
+                    model.rows.append(parsed_row)
+                if milestone_rows is not None:
+                    self._record_row_number(line, r'#(\d+)', int, milestone_rows)
             elif (in_main_table or in_cross_ref_table) and not line.startswith('|'):
                 # End of current table
                 in_main_table = False
                 in_cross_ref_table = False
+                if in_candidate_rows:
+                    in_candidate_rows = False
+                milestone_rows = None
+        
+        return model
+    
+    @staticmethod
+    def _record_row_number(line: str, key_pattern: str, key_type, row_numbers: Dict) -> None:
+        """Map the key found in a numbered row's second column to its Row #"""
+        parts = [part.strip() for part in line.split('|')]
+        if len(parts) >= 3 and parts[1].isdigit():
+            match = re.search(key_pattern, parts[2])
+            if match:
+                row_numbers[key_type(match.group(1))] = int(parts[1])
     
     def _parse_main_table_row(self, line: str, line_number: int) -> Optional[ParsedRow]:
         """Parse a main table row (format: | Row # | Jira Issue | Jira Assignee | Upstream Velero Issue(s) | Labels |)"""
@@ -182,12 +347,41 @@ class MarkdownContentChecker:
             raw_content=line,
             line_number=line_number
         )
+
+
+class MarkdownContentChecker:
+    """Checks for existing content in OADP Velero Issues markdown file"""
+    
+    def __init__(self, markdown_file_path: str, model: Optional['ReportModel'] = None):
+        self.markdown_file_path = markdown_file_path
+        self.model = model
+        self.existing_rows: List[ParsedRow] = []
+        self.jira_to_github_map: Dict[str, Set[int]] = {}
+        # First row seen for each Jira key (main table rows come before cross-reference rows)
+        self.rows_by_key: Dict[str, ParsedRow] = {}
+        
+    def load_existing_content(self) -> None:
+        """Load existing content from the parsed report model, parsing the file if none was given"""
+        if self.model is None:
+            self.model = ReportParser().parse(self.markdown_file_path)
+        
+        for parsed_row in self.model.rows:
+            self.existing_rows.append(parsed_row)
+            self._update_mapping(parsed_row)
+        
+        if self.model.source == 'state':
+            print(f"Loaded {len(self.existing_rows)} existing rows from {state_path(self.markdown_file_path)}")
+        elif self.model.exists:
+            print(f"Loaded {len(self.existing_rows)} existing rows from {self.markdown_file_path}")
+        else:
+            print(f"File {self.markdown_file_path} not found. Starting with empty content.")
     
     def _update_mapping(self, parsed_row: ParsedRow) -> None:
-        """Update the Jira to GitHub mapping with a parsed row"""
+        """Update the Jira to GitHub mapping and the key index with a parsed row"""
         if parsed_row.jira_key not in self.jira_to_github_map:
             self.jira_to_github_map[parsed_row.jira_key] = set()
         self.jira_to_github_map[parsed_row.jira_key].update(parsed_row.github_issues)
+        self.rows_by_key.setdefault(parsed_row.jira_key, parsed_row)
     
     def check_for_duplicates(self, jira_key: str, github_issues: List[int]) -> Tuple[bool, Optional[ParsedRow]]:
         """
@@ -196,26 +390,8 @@ class MarkdownContentChecker:
         Returns:
             (is_duplicate, existing_row_if_found)
         """
-        # Check if Jira key already exists
-        existing_row = None
-        for row in self.existing_rows:
-            if row.jira_key == jira_key:
-                existing_row = row
-                break
-        
-        if not existing_row:
-            return False, None
-        
-        # Compare GitHub issues as sets (order doesn't matter)
-        existing_github_set = set(existing_row.github_issues)
-        new_github_set = set(github_issues)
-        
-        # If GitHub issue sets are exactly the same, it's a duplicate (order doesn't matter)
-        if existing_github_set == new_github_set:
-            return True, existing_row
-        
-        # If GitHub issue sets are different, it's not a duplicate (should be updated)
-        return False, existing_row
+        status, existing_row = self.classify_issue(jira_key, github_issues)
+        return status == UNCHANGED, existing_row
     
     def should_update_row(self, jira_key: str, github_issues: List[int]) -> Tuple[bool, Optional[ParsedRow]]:
         """
@@ -224,13 +400,35 @@ class MarkdownContentChecker:
         Returns:
             (should_update, existing_row_if_found)
         """
-        is_duplicate, existing_row = self.check_for_duplicates(jira_key, github_issues)
+        status, existing_row = self.classify_issue(jira_key, github_issues)
+        return status == UPDATED, existing_row
+    
+    def classify_issue(self, jira_key: str, github_issues: Iterable[int]) -> Tuple[str, Optional[ParsedRow]]:
+        """
+        Classify an issue against the existing content with a single index lookup
+        
+        Returns:
+            (NEW | UPDATED | UNCHANGED, existing_row_if_found)
+        """
+        existing_row = self.rows_by_key.get(jira_key)
+        if not existing_row:
+            return NEW, None
         
-        if existing_row and not is_duplicate:
-            # Row exists but with different GitHub issues - should update
-            return True, existing_row
+        # Compare GitHub issues as sets (order doesn't matter)
+        if set(existing_row.github_issues) == set(github_issues):
+            return UNCHANGED, existing_row
         
-        return False, existing_row
+        # Row exists but with different GitHub issues - should update
+        return UPDATED, existing_row
+    
+    def classify(self, issues: Iterable[Tuple[str, Iterable[int]]]) -> List[Tuple[str, Optional[ParsedRow]]]:
+        """
+        Classify many (jira_key, github_issues) pairs at once
+        
+        Returns:
+            One (status, existing_row_if_found) tuple per input pair, in input order
+        """
+        return [self.classify_issue(jira_key, github_issues) for jira_key, github_issues in issues]
     
     def get_content_summary(self) -> Dict:
         """Get summary of existing content"""
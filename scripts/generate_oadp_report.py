@@ -7,29 +7,67 @@ This script queries Jira for OADP issues and generates a markdown report
 with their associated upstream Velero GitHub issues and labels.
 """
 
+import hashlib
+import math
 import os
 import sys
 import json
-import base64
 import requests
 import re
 import argparse
-from typing import Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass
-from urllib.parse import urlparse
+from datetime import datetime, timezone
+from functools import lru_cache
+from urllib.parse import quote, urlparse
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.dirname(SCRIPT_DIR)
 OUTPUT_DIR = os.path.join(REPO_ROOT, "output")
+CACHE_DIR = os.path.join(OUTPUT_DIR, ".cache")
+DEFAULT_WORKERS = 8
+GRAPHQL_BATCH_SIZE = 50
+GITHUB_PAGE_SIZE = 100
+GITHUB_SEARCH_RESULT_LIMIT = 1000
+MILESTONE_SOURCES = ('search', 'issues')
+DEFAULT_MILESTONES = ['v1.18']
+DEFAULT_JQL = ('project = OADP AND status not in (Closed) AND '
+               '(fixVersion = "OADP 1.6.0" OR fixVersion = "OADP 1.6.0") AND '
+               '(labels = oadp_upstream_bug_fix ) ORDER BY priority DESC, Rank ASC')
+PROJECT_ITEMS_PAGE_SIZE = 100  # GitHub's maximum for Projects v2 item connections
+# Everything JiraIssue and extract_github_references read, except remote links and the changelog
+JIRA_SEARCH_FIELDS = 'summary,status,priority,issuetype,issuelinks,assignee,description'
+JIRA_SEARCH_PAGE_SIZE = 50
+JIRA_CHANGELOG_PAGE_SIZE = 100
+# Report state hash entry covering the whole report input
+REPORT_DIGEST_KEY = '*'
+
+from http_cache import DEFAULT_MAX_BYTES, DEFAULT_TTL_SECONDS, ResponseCache
+from jira_client import JiraClient, basic_auth_header
+from rate_limit import RateLimitedAdapter, RequestScheduler
+from report_writer import MarkdownWriter
+from jira_store import JiraIssueStore
 
 # Import content checker for duplicate detection
 try:
-    from content_checker import MarkdownContentChecker, ParsedRow
+    from content_checker import (UNCHANGED, UPDATED, MarkdownContentChecker, ParsedRow, ReportModel, ReportParser,
+                                 content_hash)
 except ImportError:
     print("Warning: content_checker.py not found. Duplicate checking will be disabled.")
     MarkdownContentChecker = None
+    ReportModel = None
+    ReportParser = None
     ParsedRow = None
 
+
+@lru_cache(maxsize=None)
+def renderer_digest() -> str:
+    """Digest of this script, so rows rendered by another version of it are never reused"""
+    with open(os.path.abspath(__file__), 'rb') as script:
+        return hashlib.sha256(script.read()).hexdigest()[:16]
+
 @dataclass
 class GitHubIssue:
     """Represents a GitHub issue with its details"""
@@ -51,23 +89,172 @@ class JiraIssue:
     github_issues: List[GitHubIssue]
     url: str
 
+def build_jql(fix_versions: List[str]) -> str:
+    """The default report query, for any set of OADP fixVersions"""
+    versions = ' OR '.join(f'fixVersion = "{version}"' for version in fix_versions)
+    return ('project = OADP AND status not in (Closed) AND '
+            f'({versions}) AND '
+            '(labels = oadp_upstream_bug_fix ) ORDER BY priority DESC, Rank ASC')
+
+
+def iter_adf_text(node) -> Iterator[str]:
+    """
+    Yield the text and link targets of an Atlassian Document Format node in document order.
+    
+    Walks the tree with an explicit stack, so deeply nested documents cannot hit the
+    recursion limit, and nothing is joined until the caller asks for it.
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            yield node
+            continue
+        if not isinstance(node, dict):
+            continue
+        if node.get('type') == 'text':
+            for mark in node.get('marks', ()):
+                if mark.get('type') == 'link':
+                    href = mark.get('attrs', {}).get('href', '')
+                    if href:
+                        yield href
+            text = node.get('text', '')
+            if text:
+                yield text
+        children = node.get('content')
+        if children:
+            stack.extend(reversed(children))
+
+
+class GitHubReferenceExtractor:
+    """Finds upstream Velero issue/PR numbers in free text with a single precompiled scan"""
+    
+    # Full Velero issue/PR URLs, or issue/PR numbers mentioned without a URL
+    PATTERN = re.compile(
+        r'https://github\.com/vmware-tanzu/velero/(?:issues|pull)/(\d+)'
+        r'|(?i:issue|pr|pull|#)\s*:?\s*(\d+)'
+    )
+    # Bare numbers below this are too short to be Velero issues (which are typically 4+ digits)
+    MIN_BARE_NUMBER = 1000
+    # Joins texts for one scan; \s does not match NUL, so numbers never pair up across texts
+    SEPARATOR = '\x00'
+    
+    def find(self, text: str) -> Set[int]:
+        """Return the Velero issue numbers referenced in text"""
+        numbers = set()
+        if not text:
+            return numbers
+        for url_number, bare_number in self.PATTERN.findall(text):
+            if url_number:
+                numbers.add(int(url_number))
+            elif int(bare_number) > self.MIN_BARE_NUMBER:
+                numbers.add(int(bare_number))
+        return numbers
+    
+    def find_all(self, texts: Iterable[str]) -> Set[int]:
+        """Return the Velero issue numbers referenced in any of texts, scanning them as one buffer"""
+        return self.find(self.SEPARATOR.join(text for text in texts if text))
+
+
+GITHUB_REFERENCES = GitHubReferenceExtractor()
+
+
+class GitHubReference:
+    """The OADP issues referencing one GitHub issue, with the parts of their report cells resolved"""
+    
+    __slots__ = ('issues', 'links', 'assignees')
+    
+    def __init__(self, issues: List[JiraIssue]):
+        self.issues = issues
+        self.links = [f"[{issue.key}]({issue.url})" for issue in issues]
+        # Each assignee once, in the order their issues were indexed
+        self.assignees = list(dict.fromkeys([issue.assignee for issue in issues]))
+
+
+class GitHubReferenceIndex:
+    """
+    Inverted index from GitHub issue number to the OADP issues referencing it, built once per report.
+    
+    GitHubReference records are created on first lookup and shared by every section
+    that shows the same GitHub issue.
+    """
+    
+    __slots__ = ('_issues', '_references')
+    
+    def __init__(self, issues: Iterable[JiraIssue]):
+        by_number: Dict[int, List[JiraIssue]] = {}
+        for oadp_issue in issues:
+            for gh_issue in oadp_issue.github_issues:
+                referencing = by_number.get(gh_issue.number)
+                if referencing is None:
+                    by_number[gh_issue.number] = [oadp_issue]
+                else:
+                    referencing.append(oadp_issue)
+        self._issues = by_number
+        self._references: Dict[int, GitHubReference] = {}
+    
+    def get(self, number: int) -> Optional[GitHubReference]:
+        reference = self._references.get(number)
+        if reference is None:
+            referencing = self._issues.get(number)
+            if referencing is None:
+                return None
+            reference = self._references[number] = GitHubReference(referencing)
+        return reference
+    
+    def referencing_keys(self, numbers: Iterable[int]) -> Set[str]:
+        """Keys of the OADP issues that reference any of the GitHub issue numbers"""
+        by_number = self._issues
+        return {issue.key for number in numbers if number in by_number for issue in by_number[number]}
+
+
 class JiraGitHubReporter:
     """Main class for generating the OADP to Velero issues report"""
     
     JIRA_SITE = "redhat.atlassian.net"
 
-    def __init__(self, jira_email: str, jira_token: str, github_token: Optional[str] = None):
+    def __init__(self, jira_email: str, jira_token: str, github_token: Optional[str] = None,
+                 max_workers: int = DEFAULT_WORKERS, github_cache: Optional[ResponseCache] = None,
+                 use_graphql: bool = True, jira_store_dir: Optional[str] = None,
+                 lean_issue_details: bool = True, milestone_source: str = 'search',
+                 milestones: Optional[List[str]] = None):
         self.jira_base_url = f"https://{self.JIRA_SITE}"
         self.jira_token = jira_token
         self.github_token = github_token
-        
-        creds = base64.b64encode(f"{jira_email}:{jira_token}".encode()).decode()
-        self.jira_session = requests.Session()
-        self.jira_session.headers.update({
-            'Authorization': f'Basic {creds}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        })
+        self.max_workers = max(1, max_workers)
+        self.github_cache = github_cache
+        # Batched GraphQL hydration needs an authenticated GitHub session
+        self.use_graphql = use_graphql and bool(github_token)
+        # When set, Jira search results are synced incrementally into a local store
+        self.jira_store_dir = jira_store_dir
+        self.lean_issue_details = lean_issue_details
+        # 'search' (search API) or 'issues' (repository issue listing) for milestone issues
+        self.milestone_source = milestone_source
+        # Velero milestones that get a cross-reference section, in report order
+        self.milestones = list(milestones or DEFAULT_MILESTONES)
+        
+        # Per-run memo of GitHub issues by number; values are futures so concurrent
+        # lookups of the same issue wait for the first fetch instead of repeating it
+        self._github_issues: Dict[int, Future] = {}
+        self._github_issues_lock = threading.Lock()
+        self.github_fetches_avoided = 0
+        
+        # The previous report, loaded once per run by generate_report, and the one being generated
+        self._report_model = None
+        self._next_report_model = None
+        self._candidate_row_numbers: Dict[str, int] = {}
+        self._milestone_row_numbers: Dict[str, Dict[int, int]] = {}
+        self._rendered_rows: Dict[str, List] = {}
+        self.report_unchanged = False
+        self.rows_rendered = 0
+        self.rows_reused = 0
+        
+        # One scheduler paces every Jira and GitHub request and retries throttled ones
+        self.scheduler = RequestScheduler()
+        
+        # Size the connection pools to the worker count so concurrent lookups reuse connections
+        self.jira = JiraClient(basic_auth_header(jira_email, jira_token), site=self.JIRA_SITE,
+                               pool_size=self.max_workers, scheduler=self.scheduler)
         
         self.github_session = requests.Session()
         if github_token:
@@ -75,66 +262,73 @@ class JiraGitHubReporter:
                 'Authorization': f'token {github_token}',
                 'Accept': 'application/vnd.github.v3+json'
             })
+        self.github_session.mount('https://', RateLimitedAdapter(self.scheduler, pool_maxsize=self.max_workers))
+    
+    def _github_get_json(self, url: str, params: Optional[Dict] = None):
+        """GET a GitHub API URL, revalidating against the on-disk cache when enabled"""
+        if self.github_cache:
+            return self.github_cache.get_json(self.github_session, url, params)
+        response = self.github_session.get(url, params=params)
+        response.raise_for_status()
+        return response.json()
     
     def search_jira_issues(self, jql: str) -> List[Dict]:
         """Search for Jira issues using JQL (Cloud /search/jql endpoint)"""
-        url = f"{self.jira_base_url}/rest/api/3/search/jql"
-        
-        all_issues = []
-        next_token = None
-        
         print(f"Searching Jira with JQL: {jql}")
-        while True:
-            params = {
-                'jql': jql,
-                'fields': 'summary,status,priority,issuetype,issuelinks,assignee',
-                'maxResults': 50
-            }
-            if next_token:
-                params['nextPageToken'] = next_token
-
-            response = self.jira_session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            all_issues.extend(data.get('issues', []))
-
-            if data.get('isLast', True):
-                break
-            next_token = data.get('nextPageToken')
-            if not next_token:
-                break
-
+        all_issues = self.jira.search(jql, JIRA_SEARCH_FIELDS, page_size=JIRA_SEARCH_PAGE_SIZE)
         print(f"Found {len(all_issues)} issues")
         return all_issues
     
+    def sync_jira_issues(self, jql: str) -> List[Dict]:
+        """Search Jira, incrementally through the local issue store when one is configured"""
+        if not self.jira_store_dir:
+            return self.search_jira_issues(jql)
+        
+        store = JiraIssueStore.for_query(self.jira_store_dir, jql, JIRA_SEARCH_FIELDS)
+        issues = store.sync(jql, self.search_jira_issues, self.jira.search_keys)
+        print(f"Jira store: {store.summary()}")
+        return issues
+    
     def get_issue_details(self, issue_key: str) -> Dict:
         """Get detailed information for a specific Jira issue"""
-        url = f"{self.jira_base_url}/rest/api/3/issue/{issue_key}"
-        
         params = {
             'fields': '*all',
             'expand': 'changelog'
         }
         
-        response = self.jira_session.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self.jira.get(f"/issue/{issue_key}", params)
+    
+    def get_issue_changelog(self, issue_key: str) -> List[Dict]:
+        """Get the full change history of a Jira issue from the paginated changelog endpoint"""
+        histories = []
+        start_at = 0
+        
+        while True:
+            params = {
+                'startAt': start_at,
+                'maxResults': JIRA_CHANGELOG_PAGE_SIZE
+            }
+            data = self.jira.get(f"/issue/{issue_key}/changelog", params)
+            values = data.get('values', [])
+            histories.extend(values)
+            
+            start_at += len(values)
+            if data.get('isLast', True) or not values or start_at >= data.get('total', 0):
+                break
+        
+        return histories
     
     def get_remote_issue_links(self, issue_key: str) -> List[Dict]:
         """Get remote issue links for a Jira issue"""
-        url = f"{self.jira_base_url}/rest/api/3/issue/{issue_key}/remotelink"
-        
         try:
-            response = self.jira_session.get(url)
-            response.raise_for_status()
-            return response.json()
+            return self.jira.get(f"/issue/{issue_key}/remotelink")
         except requests.exceptions.RequestException as e:
             print(f"Warning: Could not fetch remote links for {issue_key}: {e}")
             return []
     
-    def extract_github_references(self, issue_data: Dict, remote_links: List[Dict]) -> List[str]:
-        """Extract GitHub issue URLs from Jira issue data and remote links"""
-        github_urls = set()
+    def extract_github_references(self, issue_data: Dict, remote_links: List[Dict]) -> List[int]:
+        """Extract upstream Velero issue numbers from Jira issue data and remote links"""
+        texts = []
         
         # Check issue links (internal Jira links)
         issue_links = issue_data.get('fields', {}).get('issuelinks', [])
@@ -144,103 +338,143 @@ class JiraGitHubReporter:
                 if direction in link:
                     linked_issue = link[direction]
                     # Sometimes GitHub URLs are in the summary or description
-                    summary = linked_issue.get('fields', {}).get('summary', '')
-                    urls = self._extract_github_urls_from_text(summary)
-                    github_urls.update(urls)
+                    texts.append(linked_issue.get('fields', {}).get('summary', ''))
         
         # Check remote links
         for remote_link in remote_links:
-            if 'object' in remote_link and 'url' in remote_link['object']:
-                url = remote_link['object']['url']
-                if 'github.com/vmware-tanzu/velero' in url:
-                    github_urls.add(url)
+            obj = remote_link.get('object', {})
+            url = obj.get('url', '')
+            if 'github.com/vmware-tanzu/velero' in url:
+                texts.append(url)
             
             # Also check title and summary for GitHub references
-            if 'object' in remote_link:
-                obj = remote_link['object']
-                for field in ['title', 'summary']:
-                    if field in obj:
-                        urls = self._extract_github_urls_from_text(obj[field])
-                        github_urls.update(urls)
+            for field in ['title', 'summary']:
+                if field in obj:
+                    texts.append(obj[field])
         
         # Check description for GitHub URLs (v3 API returns ADF, not plain text)
         description = issue_data.get('fields', {}).get('description') or ''
         if isinstance(description, dict):
-            description = self._extract_text_from_adf(description)
-        urls = self._extract_github_urls_from_text(description)
-        github_urls.update(urls)
+            # One fragment per description, so a keyword and its number in neighbouring nodes still pair up
+            texts.append(self._extract_text_from_adf(description))
+        else:
+            texts.append(description)
         
         # Check changelog for GitHub references
         changelog = issue_data.get('changelog', {}).get('histories', [])
         for history in changelog:
             for item in history.get('items', []):
                 for field in ['toString', 'fromString']:
-                    if field in item and item[field]:
-                        urls = self._extract_github_urls_from_text(item[field])
-                        github_urls.update(urls)
+                    if item.get(field):
+                        texts.append(item[field])
         
-        return list(github_urls)
+        return list(GITHUB_REFERENCES.find_all(texts))
     
     @staticmethod
     def _extract_text_from_adf(node) -> str:
-        """Recursively extract plain text from an Atlassian Document Format node."""
-        if isinstance(node, str):
-            return node
-        if not isinstance(node, dict):
-            return ''
-        parts = []
-        if node.get('type') == 'text':
-            text = node.get('text', '')
-            for mark in node.get('marks', []):
-                if mark.get('type') == 'link':
-                    href = mark.get('attrs', {}).get('href', '')
-                    if href:
-                        parts.append(href)
-            parts.append(text)
-        for child in node.get('content', []):
-            parts.append(JiraGitHubReporter._extract_text_from_adf(child))
-        return ' '.join(parts)
-
-    def _extract_github_urls_from_text(self, text: str) -> List[str]:
-        """Extract GitHub URLs from text using regex"""
-        if not text:
-            return []
-        
-        # Pattern for GitHub URLs
-        github_pattern = r'https://github\.com/vmware-tanzu/velero/(?:issues|pull)/(\d+)'
-        matches = re.findall(github_pattern, text)
-        
-        # Also look for issue/PR numbers mentioned without full URLs
-        number_pattern = r'(?:issue|pr|pull|#)\s*:?\s*(\d+)'
-        number_matches = re.findall(number_pattern, text, re.IGNORECASE)
-        
-        urls = []
-        
-        # Add full URLs
-        for match in matches:
-            urls.append(f'https://github.com/vmware-tanzu/velero/issues/{match}')
-        
-        # Add URLs constructed from issue numbers (if they look like Velero issue numbers)
-        for number in number_matches:
-            if int(number) > 1000:  # Velero issues are typically 4+ digits
-                urls.append(f'https://github.com/vmware-tanzu/velero/issues/{number}')
-        
-        return list(set(urls))  # Remove duplicates
+        """Extract plain text (and link targets) from an Atlassian Document Format node."""
+        return ' '.join(iter_adf_text(node))
     
-    def get_github_issue_details(self, github_url: str) -> Optional[GitHubIssue]:
-        """Get details for a GitHub issue"""
-        # Extract issue number from URL
-        match = re.search(r'/issues/(\d+)', github_url)
-        if not match:
-            return None
+    def _remember_github_issue(self, github_issue: GitHubIssue) -> None:
+        """Seed the per-run memo with an issue obtained from a bulk query"""
+        with self._github_issues_lock:
+            if github_issue.number not in self._github_issues:
+                future = Future()
+                future.set_result(github_issue)
+                self._github_issues[github_issue.number] = future
+    
+    def _reserve_github_issues(self, issue_numbers: List[int]) -> List[int]:
+        """Claim memo slots for issue numbers and return the ones that still need fetching"""
+        to_fetch = []
+        with self._github_issues_lock:
+            for number in issue_numbers:
+                if number in self._github_issues:
+                    self.github_fetches_avoided += 1
+                else:
+                    self._github_issues[number] = Future()
+                    to_fetch.append(number)
+        return to_fetch
+    
+    def _hydrate_github_issues(self, issue_numbers: List[int]) -> None:
+        """Resolve reserved memo slots, in one GraphQL request when possible"""
+        futures = [self._github_issues[number] for number in issue_numbers]
+        try:
+            resolved = self.get_github_issues_batch(issue_numbers) if self.use_graphql else {}
+            for number, future in zip(issue_numbers, futures):
+                if number in resolved:
+                    future.set_result(resolved[number])
+                else:
+                    future.set_result(self._fetch_github_issue(number))
+        except BaseException as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            raise
+    
+    def get_github_issues_batch(self, issue_numbers: List[int]) -> Dict[int, Optional[GitHubIssue]]:
+        """
+        Fetch several Velero issues or pull requests in a single GraphQL request.
         
-        issue_number = int(match.group(1))
-        api_url = f'https://api.github.com/repos/vmware-tanzu/velero/issues/{issue_number}'
+        Each number becomes an aliased ``repository.issueOrPullRequest(number:)`` field.
+        Numbers that do not exist map to None; numbers missing from the result (for
+        example when the request itself failed) should be fetched over REST.
+        """
+        if not issue_numbers:
+            return {}
+        
+        fields = "number title state url labels(first: 100) { nodes { name } }"
+        aliases = "\n".join(
+            f"i{number}: issueOrPullRequest(number: {number}) {{ ... on Issue {{ {fields} }} ... on PullRequest {{ {fields} }} }}"
+            for number in issue_numbers
+        )
+        graphql_query = f"""
+        query {{
+          repository(owner: "vmware-tanzu", name: "velero") {{
+            {aliases}
+          }}
+        }}
+        """
         
         try:
-            response = self.github_session.get(api_url)
+            response = self.github_session.post(
+                'https://api.github.com/graphql',
+                json={'query': graphql_query}
+            )
             response.raise_for_status()
             data = response.json()
+        except requests.exceptions.RequestException as e:
+            print(f"Warning: GraphQL batch of {len(issue_numbers)} GitHub issues failed, falling back to REST: {e}")
+            return {}
+        
+        repository = (data.get('data') or {}).get('repository')
+        if not repository:
+            print(f"Warning: GraphQL batch of {len(issue_numbers)} GitHub issues failed, "
+                  f"falling back to REST: {data.get('errors')}")
+            return {}
+        
+        issues = {}
+        for number in issue_numbers:
+            node = repository.get(f"i{number}")
+            if not node:
+                issues[number] = None
+                continue
+            # GraphQL reports merged pull requests as MERGED; REST calls them closed
+            state = node['state'].lower()
+            issues[number] = GitHubIssue(
+                number=node['number'],
+                title=node['title'],
+                state='closed' if state == 'merged' else state,
+                labels=[label['name'] for label in node.get('labels', {}).get('nodes', [])],
+                url=node['url']
+            )
+        return issues
+    
+    def _fetch_github_issue(self, issue_number: int) -> Optional[GitHubIssue]:
+        """Fetch a single GitHub issue from the REST API"""
+        api_url = f'https://api.github.com/repos/vmware-tanzu/velero/issues/{issue_number}'
+        
+        try:
+            data = self._github_get_json(api_url)
             
             labels = [label['name'] for label in data.get('labels', [])]
             
@@ -255,62 +489,153 @@ class JiraGitHubReporter:
             print(f"Warning: Could not fetch GitHub issue {issue_number}: {e}")
             return None
     
-    def get_velero_milestone_issues(self, milestone: str) -> List[GitHubIssue]:
-        """Get all issues from a specific Velero milestone using GitHub search API"""
-        print(f"\nFetching Velero milestone {milestone} issues...")
+    def get_velero_milestone_issues(self, milestone: str,
+                                    log: Callable[[str], None] = print) -> List[GitHubIssue]:
+        """
+        Get all issues from a specific Velero milestone.
+        
+        With the default 'search' source the first search page reports total_count and
+        the remaining pages are fetched concurrently. The 'issues' source lists the
+        milestone through /repos/.../issues?milestone=<number>, which draws on the core
+        rate limit instead of the much smaller search budget.
+        
+        Progress and warnings go to log, so concurrent fetches can keep their output apart.
+        """
+        log(f"\nFetching Velero milestone {milestone} issues...")
+        
+        try:
+            if self.milestone_source == 'issues':
+                pages = self._list_milestone_issue_pages(milestone, log)
+            else:
+                pages = self._search_milestone_issue_pages(milestone, log)
+        except requests.exceptions.RequestException as e:
+            log(f"Warning: Could not fetch Velero {milestone} milestone issues: {e}")
+            pages = []
         
+        all_issues = []
+        for issues in pages:
+            for issue_data in issues:
+                # Skip pull requests (they appear in search and issue listings)
+                if 'pull_request' in issue_data:
+                    continue
+                
+                labels = [label['name'] for label in issue_data.get('labels', [])]
+                github_issue = GitHubIssue(
+                    number=issue_data['number'],
+                    title=issue_data['title'],
+                    state=issue_data['state'],
+                    labels=labels,
+                    url=issue_data['html_url']
+                )
+                all_issues.append(github_issue)
+                self._remember_github_issue(github_issue)
+        
+        log(f"Found {len(all_issues)} issues in Velero {milestone} milestone")
+        return all_issues
+    
+    def _search_milestone_issue_pages(self, milestone: str, log: Callable[[str], None] = print) -> List[List[Dict]]:
+        """Milestone issues from the search API, one list per page in sort order"""
         # Use GitHub search API to find issues by milestone
         api_url = 'https://api.github.com/search/issues'
         query = f'repo:vmware-tanzu/velero milestone:{milestone} is:issue'
         params = {
             'q': query,
-            'per_page': 100,
+            'per_page': GITHUB_PAGE_SIZE,
             'sort': 'created',
             'order': 'desc'
         }
         
-        all_issues = []
-        page = 1
+        first_page = self._github_get_json(api_url, dict(params, page=1))
+        # Search only ever returns the first 1000 results
+        total = min(first_page.get('total_count', 0), GITHUB_SEARCH_RESULT_LIMIT)
+        page_count = math.ceil(total / GITHUB_PAGE_SIZE)
+        return [first_page.get('items', [])] + self._get_github_pages(
+            api_url, params, range(2, page_count + 1), items_key='items',
+            label=f"Velero {milestone} milestone issues", log=log
+        )
+    
+    def _list_milestone_issue_pages(self, milestone: str, log: Callable[[str], None] = print) -> List[List[Dict]]:
+        """Milestone issues (and pull requests) from the repository issue listing, one list per page"""
+        milestone_number, item_count = self._find_velero_milestone(milestone)
+        if milestone_number is None:
+            log(f"Warning: Velero milestone {milestone} not found")
+            return []
         
-        while True:
-            params['page'] = page
+        api_url = 'https://api.github.com/repos/vmware-tanzu/velero/issues'
+        params = {
+            'milestone': milestone_number,
+            'state': 'all',
+            'per_page': GITHUB_PAGE_SIZE,
+            'sort': 'created',
+            'direction': 'desc'
+        }
+        
+        # The milestone's open/closed counts (issues and pull requests) give the page count
+        page_count = math.ceil(item_count / GITHUB_PAGE_SIZE)
+        pages = self._get_github_pages(api_url, params, range(1, page_count + 1),
+                                       label=f"Velero {milestone} milestone issues", log=log)
+        
+        # Items added since the counts were read spill onto further pages
+        while len(pages) == page_count and pages and len(pages[-1]) == GITHUB_PAGE_SIZE:
+            page_count += 1
             try:
-                response = self.github_session.get(api_url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                issues = data.get('items', [])
-                if not issues:
-                    break
-                
-                for issue_data in issues:
-                    # Skip pull requests (they appear in search results)
-                    if 'pull_request' in issue_data:
-                        continue
-                    
-                    labels = [label['name'] for label in issue_data.get('labels', [])]
-                    github_issue = GitHubIssue(
-                        number=issue_data['number'],
-                        title=issue_data['title'],
-                        state=issue_data['state'],
-                        labels=labels,
-                        url=issue_data['html_url']
-                    )
-                    all_issues.append(github_issue)
-                
-                # Check if we have more pages
-                if len(issues) < params['per_page']:
-                    break
-                
-                page += 1
-                
+                items = self._github_get_json(api_url, dict(params, page=page_count))
             except requests.exceptions.RequestException as e:
-                print(f"Warning: Could not fetch milestone issues: {e}")
+                # Keep the pages already fetched, like _get_github_pages does
+                log(f"Warning: Could not fetch page {page_count} of Velero {milestone} milestone issues: {e}")
+                break
+            if not items:
                 break
+            pages.append(items)
+        return pages
+    
+    def _find_velero_milestone(self, milestone: str) -> Tuple[Optional[int], int]:
+        """Number and open+closed item count of the Velero milestone with the given title"""
+        api_url = 'https://api.github.com/repos/vmware-tanzu/velero/milestones'
+        params = {'state': 'all', 'per_page': GITHUB_PAGE_SIZE}
+        page = 1
+        while True:
+            milestones = self._github_get_json(api_url, dict(params, page=page))
+            for entry in milestones:
+                if entry.get('title') == milestone:
+                    return entry['number'], entry.get('open_issues', 0) + entry.get('closed_issues', 0)
+            if len(milestones) < GITHUB_PAGE_SIZE:
+                return None, 0
+            page += 1
+    
+    def _get_github_pages(self, url: str, params: Dict, pages: Iterable[int],
+                          items_key: Optional[str] = None, label: Optional[str] = None,
+                          log: Callable[[str], None] = print) -> List[List[Dict]]:
+        """
+        Fetch numbered pages of a GitHub listing concurrently and return their items in page order.
         
-        print(f"Found {len(all_issues)} issues in Velero {milestone} milestone")
-        return all_issues
-
+        Stops at the first page that fails or comes back short, like a serial walk would.
+        Warnings go to log and name the listing by label (default: the URL).
+        """
+        def fetch(page: int) -> List[Dict]:
+            data = self._github_get_json(url, dict(params, page=page))
+            return data.get(items_key, []) if items_key else data
+        
+        pages = list(pages)
+        results = []
+        if not pages:
+            return results
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='github-pages') as pool:
+            futures = [pool.submit(fetch, page) for page in pages]
+            for page, future in zip(pages, futures):
+                try:
+                    items = future.result()
+                except requests.exceptions.RequestException as e:
+                    log(f"Warning: Could not fetch page {page} of {label or url}: {e}")
+                    items = None
+                if items:
+                    results.append(items)
+                if not items or len(items) < GITHUB_PAGE_SIZE:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        return results
+    
     def get_migtools_project_issues(self, org: str = "migtools", project_number: int = 7) -> List[str]:
         """Get issues from GitHub project board using GraphQL API"""
         print(f"\nFetching {org} project {project_number} issues...")
@@ -319,33 +644,28 @@ class JiraGitHubReporter:
             print("Warning: GitHub token required for Projects v2 API access")
             return []
         
-        # GraphQL query for Projects v2
+        # GraphQL query for Projects v2, selecting only what _generate_migtools_section renders
         graphql_query = """
-        query($org: String!, $projectNumber: Int!) {
+        query($org: String!, $projectNumber: Int!, $pageSize: Int!, $cursor: String) {
           organization(login: $org) {
             projectV2(number: $projectNumber) {
-              title
-              items(first: 100) {
+              items(first: $pageSize, after: $cursor) {
+                pageInfo {
+                  hasNextPage
+                  endCursor
+                }
                 nodes {
                   content {
                     ... on Issue {
                       number
-                      title
                       repository {
-                        name
-                        owner {
-                          login
-                        }
+                        nameWithOwner
                       }
                     }
                     ... on PullRequest {
                       number
-                      title
                       repository {
-                        name
-                        owner {
-                          login
-                        }
+                        nameWithOwner
                       }
                     }
                   }
@@ -356,12 +676,13 @@ class JiraGitHubReporter:
         }
         """
         
-        variables = {
-            "org": org,
-            "projectNumber": project_number
-        }
-        
-        try:
+        def fetch_page(cursor: Optional[str]) -> Dict:
+            variables = {
+                "org": org,
+                "projectNumber": project_number,
+                "pageSize": PROJECT_ITEMS_PAGE_SIZE,
+                "cursor": cursor
+            }
             response = self.github_session.post(
                 'https://api.github.com/graphql',
                 json={
@@ -370,31 +691,39 @@ class JiraGitHubReporter:
                 }
             )
             response.raise_for_status()
-            data = response.json()
-            
-            if 'errors' in data:
-                print(f"GraphQL errors: {data['errors']}")
-                return []
-            
-            project_items = []
-            project_data = data.get('data', {}).get('organization', {}).get('projectV2', {})
-            
-            if not project_data:
-                print("Warning: Could not access migtools project data (may require permissions)")
-                return []
-            
-            items = project_data.get('items', {}).get('nodes', [])
-            
-            for item in items:
-                content = item.get('content', {})
-                if content:
-                    repo_info = content.get('repository', {})
-                    owner = repo_info.get('owner', {}).get('login', '')
-                    repo_name = repo_info.get('name', '')
-                    number = content.get('number', '')
+            return response.json()
+        
+        project_items = []
+        try:
+            # One page in flight at a time: the next page is requested as soon as this
+            # page's cursor is known, and fetched while this page is parsed
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix='github-project') as pool:
+                pending = pool.submit(fetch_page, None)
+                while pending:
+                    data = pending.result()
+                    pending = None
+                    
+                    if 'errors' in data:
+                        print(f"GraphQL errors: {data['errors']}")
+                        return []
+                    
+                    project_data = ((data.get('data') or {}).get('organization') or {}).get('projectV2')
+                    if not project_data:
+                        print("Warning: Could not access migtools project data (may require permissions)")
+                        return []
                     
-                    if owner and repo_name and number:
-                        project_items.append(f"{owner}/{repo_name}#{number}")
+                    items = project_data.get('items') or {}
+                    page_info = items.get('pageInfo') or {}
+                    if page_info.get('hasNextPage') and page_info.get('endCursor'):
+                        pending = pool.submit(fetch_page, page_info['endCursor'])
+                    
+                    for item in items.get('nodes', []):
+                        content = item.get('content') or {}
+                        repository = (content.get('repository') or {}).get('nameWithOwner', '')
+                        number = content.get('number', '')
+                        
+                        if repository and number:
+                            project_items.append(f"{repository}#{number}")
             
             print(f"Found {len(project_items)} issues in {org} project {project_number}")
             return project_items
@@ -406,21 +735,244 @@ class JiraGitHubReporter:
 
     def generate_report(self, jql: str, output_file: str = None) -> str:
         """Generate the complete markdown report"""
+        return '\n'.join(self.iter_report(jql, output_file))
+    
+    def write_report(self, jql: str, output_file: str = None, force: bool = False) -> bool:
+        """
+        Stream the report to output_file, replacing it only once complete, then write its state file.
+        
+        Returns False without rendering or touching the report when nothing it shows has
+        changed since the previous run (unless force is set).
+        """
+        self.prepare_report(jql, output_file)
+        if self.report_unchanged and not force:
+            print(f"\nReport unchanged since {self._report_model.changed_at.get(REPORT_DIGEST_KEY)}; "
+                  f"leaving {self._output_file} as is")
+            self._report_model.fetched_at = self._next_report_model.fetched_at
+            self._next_report_model = self._report_model
+            self.save_report_state()
+            return False
+        with MarkdownWriter(self._output_file) as writer:
+            writer.write_lines(self._iter_prepared_report())
+        self.save_report_state()
+        return True
+    
+    def iter_report(self, jql: str, output_file: str = None) -> Iterator[str]:
+        """Fetch and classify every issue, then yield the lines of the markdown report"""
+        self.prepare_report(jql, output_file)
+        yield from self._iter_prepared_report()
+    
+    def prepare_report(self, jql: str, output_file: str = None) -> None:
+        """Fetch and classify every issue and decide whether the report has changed"""
         if output_file is None:
             output_file = os.path.join(OUTPUT_DIR, "oadp_velero_issues.md")
         self._output_file = output_file
 
         print("Starting OADP to Velero issues report generation...")
         
-        # Search for Jira issues
-        jira_issues_data = self.search_jira_issues(jql)
+        fetched_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        
+        # Load the previous report once (state file, else the markdown itself);
+        # row numbers and duplicate checks both come from it
+        self._report_model = ReportParser().load(output_file) if ReportParser else None
+        if self._report_model and self._report_model.source == 'state':
+            print(f"Loaded previous report state (fetched {self._report_model.fetched_at})")
+        
+        # Fetch the Velero milestones concurrently with the Jira search; they seed the
+        # GitHub issue memo, so enrichment only starts once they are all in. Each fetch
+        # buffers its progress, printed per milestone once it is done
+        milestone_logs = {milestone: [] for milestone in self.milestones}
+        with ThreadPoolExecutor(max_workers=len(self.milestones), thread_name_prefix='milestone') as pool:
+            milestone_futures = [pool.submit(self.get_velero_milestone_issues, milestone,
+                                             milestone_logs[milestone].append)
+                                 for milestone in self.milestones]
+            
+            # Search for Jira issues
+            jira_issues_data = self.sync_jira_issues(jql)
+            
+            velero_milestone_issues = {}
+            for milestone, future in zip(self.milestones, milestone_futures):
+                velero_milestone_issues[milestone] = future.result()
+                for line in milestone_logs[milestone]:
+                    print(line)
+        
+        processed_issues = self._enrich_issues(jira_issues_data)
+        print(f"\nGitHub issue lookups: {len(self._github_issues)} unique issues, "
+              f"{self.github_fetches_avoided} repeat fetches avoided")
+        
+        # Check for content changes
+        print("\n" + "-"*50)
+        print("Checking for content changes...")
+        new_issues, updated_issues, unchanged_issues = self._check_content_changes(processed_issues, output_file)
         
-        processed_issues = []
+        if self.github_cache:
+            print(f"\nGitHub cache: {self.github_cache.summary()}")
+        print(f"\nRequest scheduler:\n{self.scheduler.summary()}")
+        
+        self._prepared = (processed_issues, jql, velero_milestone_issues)
+        self._next_report_model = self._start_report_model(output_file, jql, processed_issues,
+                                                           velero_milestone_issues, fetched_at)
+        previous = self._report_model
+        self.report_unchanged = bool(
+            self._next_report_model and previous and previous.source == 'state'
+            and previous.hashes.get(REPORT_DIGEST_KEY) == self._next_report_model.hashes[REPORT_DIGEST_KEY]
+        )
+    
+    def _iter_prepared_report(self) -> Iterator[str]:
+        """Yield the markdown for the issues gathered by prepare_report and record its rows in the next state"""
+        processed_issues, jql, velero_milestone_issues = self._prepared
+        self._rendered_rows = {}
+        self._milestone_row_numbers = {}
+        self.rows_rendered = self.rows_reused = 0
+        yield from self._generate_markdown(processed_issues, jql, velero_milestone_issues)
+        if self._report_model and self._report_model.source == 'state':
+            print(f"\nRendered {self.rows_rendered} changed rows, reused {self.rows_reused} unchanged rows")
+        if self._next_report_model:
+            self._next_report_model.candidate_rows = dict(self._candidate_row_numbers)
+            self._next_report_model.milestone_rows = dict(self._milestone_row_numbers)
+            self._next_report_model.rendered = self._rendered_rows
+    
+    def _start_report_model(self, output_file: str, jql: str, issues: List[JiraIssue],
+                            milestone_issues: Dict[str, List[GitHubIssue]], fetched_at: str):
+        """
+        Model of the report about to be rendered, for the state file.
         
-        for issue_data in jira_issues_data:
-            issue_key = issue_data['key']
-            print(f"\nProcessing {issue_key}...")
+        Holds a content hash per issue and milestone entry plus a digest of the whole
+        report input (REPORT_DIGEST_KEY); row numbers and rendered rows are added by
+        _iter_prepared_report.
+        """
+        if not ReportModel:
+            return None
+        previous = self._report_model
+        model = ReportModel(
+            path=output_file,
+            exists=True,
+            rows=[
+                ParsedRow(
+                    jira_key=issue.key,
+                    jira_summary=issue.summary,
+                    assignee=issue.assignee,
+                    github_issues=[gh.number for gh in issue.github_issues],
+                    github_labels='',
+                    raw_content='',
+                    line_number=0
+                ) for issue in issues
+            ],
+            source='state',
+            fetched_at=fetched_at
+        )
+        
+        entries = [(issue.key, [issue.key, issue.summary, issue.assignee,
+                                [self._github_issue_fields(gh) for gh in issue.github_issues]])
+                   for issue in issues]
+        entries += [(f'#{gh.number}', self._github_issue_fields(gh))
+                    for issues_in_milestone in milestone_issues.values() for gh in issues_in_milestone]
+        for key, value in entries:
+            model.hashes[key] = content_hash(value)
+        # Same renderer, query, milestones and entries in the same order: the report would come out identical
+        model.hashes[REPORT_DIGEST_KEY] = content_hash([renderer_digest(), jql, list(milestone_issues),
+                                                        [key for key, _ in entries],
+                                                        [model.hashes[key] for key, _ in entries]])
+        
+        for key, digest in model.hashes.items():
+            unchanged = previous is not None and previous.hashes.get(key) == digest
+            model.changed_at[key] = previous.changed_at.get(key, fetched_at) if unchanged else fetched_at
+        return model
+    
+    @staticmethod
+    def _github_issue_fields(gh_issue: GitHubIssue) -> List:
+        """The GitHub issue fields that appear in the report"""
+        return [gh_issue.number, gh_issue.title, gh_issue.state, gh_issue.labels, gh_issue.url]
+    
+    def _row_hash(self, key: str, *extra) -> Optional[str]:
+        """Hash of everything a report row shows, or None when content hashes are unavailable"""
+        if not self._next_report_model:
+            return None
+        return content_hash([renderer_digest(), self._next_report_model.hashes[key], list(extra)])
+    
+    def _row_cells(self, key: str, row_hash: Optional[str], render: Callable[[], str]) -> str:
+        """A row's rendered cells, reused from the previous report when its hash is unchanged"""
+        previous = self._report_model.rendered.get(key) if self._report_model and row_hash else None
+        if previous and previous[0] == row_hash:
+            cells = previous[1]
+            self.rows_reused += 1
+        else:
+            cells = render()
+            self.rows_rendered += 1
+        if row_hash:
+            self._rendered_rows[key] = [row_hash, cells]
+        return cells
+    
+    def save_report_state(self) -> None:
+        """Write the state file for the report generated by write_report, once it is on disk"""
+        if self._next_report_model is None:
+            return
+        try:
+            self._next_report_model.write_state()
+        except OSError as e:
+            print(f"Warning: Could not write report state: {e}")
+    
+    def _enrich_issues(self, jira_issues_data: List[Dict]) -> List[JiraIssue]:
+        """
+        Fetch details, remote links and upstream GitHub issues for every search hit.
+        
+        Jira lookups run on one bounded pool and GitHub lookups on another. GitHub
+        issue numbers are queued (in GraphQL batches when available) as soon as each
+        Jira result arrives, so both fan-outs overlap. Results are assembled in the
+        original search order.
+        """
+        batch_size = GRAPHQL_BATCH_SIZE if self.use_graphql else 1
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='jira') as jira_pool, \
+                ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='github') as github_pool:
+            jira_futures = [
+                jira_pool.submit(self._fetch_jira_issue, issue_data)
+                for issue_data in jira_issues_data
+            ]
+            
+            pending_numbers = []
+            for jira_future in as_completed(jira_futures):
+                _, github_numbers = jira_future.result()
+                pending_numbers.extend(self._reserve_github_issues(github_numbers))
+                while len(pending_numbers) >= batch_size:
+                    github_pool.submit(self._hydrate_github_issues, pending_numbers[:batch_size])
+                    pending_numbers = pending_numbers[batch_size:]
+            if pending_numbers:
+                github_pool.submit(self._hydrate_github_issues, pending_numbers)
             
+            processed_issues = []
+            for issue_data, jira_future in zip(jira_issues_data, jira_futures):
+                issue_key = issue_data['key']
+                print(f"\nProcessing {issue_key}...")
+                
+                detailed_issue, github_numbers = jira_future.result()
+                
+                github_issues = []
+                for number in github_numbers:
+                    github_issue = self._github_issues[number].result()
+                    if github_issue:
+                        github_issues.append(github_issue)
+                        print(f"  Found GitHub issue: #{github_issue.number} - {github_issue.title}")
+                
+                processed_issues.append(self._build_jira_issue(issue_key, detailed_issue, github_issues))
+        
+        return processed_issues
+    
+    def _fetch_jira_issue(self, issue_data: Dict) -> Tuple[Dict, List[int]]:
+        """Fetch the Jira data one issue still needs and return it with its referenced GitHub issue numbers"""
+        issue_key = issue_data['key']
+        
+        if self.lean_issue_details:
+            # The search already returned the fields, description and issue links, so
+            # only remote links are fetched per issue, plus the changelog as a last resort
+            detailed_issue = dict(issue_data)
+            remote_links = self.get_remote_issue_links(issue_key)
+            github_numbers = self.extract_github_references(detailed_issue, remote_links)
+            
+            if not github_numbers:
+                detailed_issue['changelog'] = {'histories': self.get_issue_changelog(issue_key)}
+                github_numbers = self.extract_github_references(detailed_issue, remote_links)
+        else:
             # Get detailed issue information
             detailed_issue = self.get_issue_details(issue_key)
             
@@ -428,44 +980,26 @@ class JiraGitHubReporter:
             remote_links = self.get_remote_issue_links(issue_key)
             
             # Extract GitHub references
-            github_urls = self.extract_github_references(detailed_issue, remote_links)
-            
-            # Get GitHub issue details
-            github_issues = []
-            for url in github_urls:
-                github_issue = self.get_github_issue_details(url)
-                if github_issue:
-                    github_issues.append(github_issue)
-                    print(f"  Found GitHub issue: #{github_issue.number} - {github_issue.title}")
-            
-            # Create Jira issue object
-            fields = detailed_issue['fields']
-            assignee_info = fields.get('assignee')
-            assignee = assignee_info.get('displayName', 'Unassigned') if assignee_info else 'Unassigned'
-            
-            jira_issue = JiraIssue(
-                key=issue_key,
-                summary=fields.get('summary', ''),
-                status=fields.get('status', {}).get('name', 'Unknown'),
-                priority=fields.get('priority', {}).get('name', 'Unknown'),
-                issue_type=fields.get('issuetype', {}).get('name', 'Unknown'),
-                assignee=assignee,
-                github_issues=github_issues,
-                url=f"https://{self.JIRA_SITE}/browse/{issue_key}"
-            )
-            
-            processed_issues.append(jira_issue)
-        
-        # Check for content changes
-        print("\n" + "-"*50)
-        print("Checking for content changes...")
-        new_issues, updated_issues, unchanged_issues = self._check_content_changes(processed_issues, output_file)
+            github_numbers = self.extract_github_references(detailed_issue, remote_links)
         
-        # Get Velero 1.18 milestone issues
-        velero_milestone_issues = self.get_velero_milestone_issues('v1.18')
-        
-        # Generate markdown report
-        return self._generate_markdown(processed_issues, jql, velero_milestone_issues)
+        return detailed_issue, github_numbers
+    
+    def _build_jira_issue(self, issue_key: str, issue_data: Dict, github_issues: List[GitHubIssue]) -> JiraIssue:
+        """Create a JiraIssue from Jira issue data and its resolved GitHub issues"""
+        fields = issue_data['fields']
+        assignee_info = fields.get('assignee')
+        assignee = assignee_info.get('displayName', 'Unassigned') if assignee_info else 'Unassigned'
+        
+        return JiraIssue(
+            key=issue_key,
+            summary=fields.get('summary', ''),
+            status=fields.get('status', {}).get('name', 'Unknown'),
+            priority=fields.get('priority', {}).get('name', 'Unknown'),
+            issue_type=fields.get('issuetype', {}).get('name', 'Unknown'),
+            assignee=assignee,
+            github_issues=github_issues,
+            url=f"https://{self.JIRA_SITE}/browse/{issue_key}"
+        )
     
     def _check_content_changes(self, issues: List[JiraIssue], output_file: str = "oadp_velero_issues.md") -> Tuple[List[JiraIssue], List[JiraIssue], List[JiraIssue]]:
         """
@@ -479,23 +1013,24 @@ class JiraGitHubReporter:
             return issues, [], []
         
         # Load existing content
-        checker = MarkdownContentChecker(output_file)
+        checker = MarkdownContentChecker(output_file, model=self._report_model)
         checker.load_existing_content()
         
         new_issues = []
         updated_issues = []
         unchanged_issues = []
         
-        for issue in issues:
+        classifications = checker.classify(
+            (issue.key, [gh.number for gh in issue.github_issues]) for issue in issues
+        )
+        
+        for issue, (status, existing_row) in zip(issues, classifications):
             github_numbers = [gh.number for gh in issue.github_issues]
             
-            is_duplicate, existing_row = checker.check_for_duplicates(issue.key, github_numbers)
-            should_update, _ = checker.should_update_row(issue.key, github_numbers)
-            
-            if is_duplicate:
+            if status == UNCHANGED:
                 unchanged_issues.append(issue)
                 print(f"✓ {issue.key}: Content unchanged (same GitHub issues: {github_numbers})")
-            elif should_update:
+            elif status == UPDATED:
                 updated_issues.append(issue)
                 existing_github = existing_row.github_issues if existing_row else []
                 print(f"⚠ {issue.key}: GitHub issues changed from {existing_github} to {github_numbers}")
@@ -510,27 +1045,29 @@ class JiraGitHubReporter:
         
         return new_issues, updated_issues, unchanged_issues
 
-    def _generate_markdown(self, issues: List[JiraIssue], jql: str, velero_milestone_issues: List[GitHubIssue]) -> str:
-        """Generate the markdown report from processed issues"""
+    def _generate_markdown(self, issues: List[JiraIssue], jql: str,
+                           velero_milestone_issues: Dict[str, List[GitHubIssue]]) -> Iterator[str]:
+        """Yield the lines of the markdown report for the processed issues"""
         
-        # First, identify which OADP issues are referenced by milestone issues
-        milestone_github_numbers = {issue.number for issue in velero_milestone_issues}
-        issues_in_milestone = set()
+        # GitHub issue number -> OADP issues referencing it, shared by every milestone section
+        references = GitHubReferenceIndex(issues)
         
-        for oadp_issue in issues:
-            for gh_issue in oadp_issue.github_issues:
-                if gh_issue.number in milestone_github_numbers:
-                    issues_in_milestone.add(oadp_issue.key)
-                    break
+        # First, identify which OADP issues are referenced by milestone issues
+        issues_in_milestone = references.referencing_keys(
+            gh_issue.number for milestone_issues in velero_milestone_issues.values() for gh_issue in milestone_issues
+        )
         
         # Filter out issues that appear in milestone section
         candidate_issues = [issue for issue in issues if issue.key not in issues_in_milestone]
         
-        # Load existing content to preserve order and row numbers
-        existing_candidate_table = self._load_existing_candidate_table()
-        existing_milestone_table = self._load_existing_milestone_table()
+        milestones = list(velero_milestone_issues)
+        milestone_names = ' or '.join(filter(None, [', '.join(milestones[:-1]), milestones[-1]]))
+        sections = 'section' if len(milestones) == 1 else 'sections'
         
-        markdown_lines = [
+        # Existing row numbers preserve the order of the previous report
+        existing_candidate_table = self._report_model.candidate_rows if self._report_model else {}
+        
+        yield from [
             "# OADP Issues and Upstream Velero Issue Mapping",
             "",
             "This document contains a mapping of OADP Jira issues to their associated upstream Velero GitHub issues and labels.",
@@ -539,7 +1076,7 @@ class JiraGitHubReporter:
             "",
             "## Jira to Upstream Candidate",
             "",
-            "*Note: OADP issues that reference Velero v1.18 milestone issues are shown in the milestone cross-reference section below.*",
+            f"*Note: OADP issues that reference Velero {milestone_names} milestone issues are shown in the milestone cross-reference {sections} below.*",
             "",
             "| Row # | Jira Issue | Jira Assignee | Upstream Velero Issue(s) | Upstream Velero Issue Labels |",
             "|-------|------------|---------------|---------------------------|------------------------------|"
@@ -550,149 +1087,35 @@ class JiraGitHubReporter:
         
         # Generate ordered candidate table with row numbers
         ordered_candidate_rows = self._generate_ordered_candidate_table(candidate_issues, existing_candidate_table)
+        self._candidate_row_numbers = {issue.key: row_num for row_num, issue in ordered_candidate_rows}
         
         for row_num, issue in ordered_candidate_rows:
-            # Format Jira issue cell
-            jira_cell = f"[{issue.key}]({issue.url}) - {issue.summary}"
-            
-            # Format GitHub issues cell
             if issue.github_issues:
-                github_parts = []
-                for gh_issue in issue.github_issues:
-                    state_info = f" ({gh_issue.state})"
-                    github_link_text = f"[#{gh_issue.number}]({gh_issue.url}) - {gh_issue.title}{state_info}"
-                    
-                    # Apply formatting for closed issues (GitHub markdown doesn't support custom colors)
-                    if gh_issue.state.lower() == "closed":
-                        github_link_text = f"✅ **{github_link_text}**"
-                    
-                    github_parts.append(github_link_text)
-                github_cell = "<br>".join(github_parts)
                 issues_with_github += 1
             else:
-                github_cell = "*No upstream GitHub issue found*"
                 issues_without_github += 1
             
-            # Format labels cell
-            if issue.github_issues:
-                label_parts = []
-                for gh_issue in issue.github_issues:
-                    if gh_issue.labels:
-                        labels_str = ", ".join(gh_issue.labels)
-                        label_parts.append(f"**#{gh_issue.number}**: {labels_str}")
-                    else:
-                        label_parts.append(f"**#{gh_issue.number}**: *No labels*")
-                labels_cell = "<br>".join(label_parts) if label_parts else "*N/A*"
-            else:
-                labels_cell = "*N/A*"
-            
-            markdown_lines.append(f"| {row_num} | {jira_cell} | {issue.assignee} | {github_cell} | {labels_cell} |")
+            cells = self._row_cells(issue.key, self._row_hash(issue.key),
+                                    lambda: self._format_candidate_cells(issue))
+            yield f"| {row_num} | {cells}"
         
         # Add summary
         milestone_referenced_count = len(issues_in_milestone)
-        markdown_lines.extend([
+        yield from [
             "",
             "## Summary",
             "",
             f"- **Total Issues**: {len(issues)}",
             f"- **Issues in Candidate Table**: {len(candidate_issues)}",
-            f"- **Issues Referenced in Milestone Section**: {milestone_referenced_count}",
+            f"- **Issues Referenced in Milestone {sections.capitalize()}**: {milestone_referenced_count}",
             f"- **Issues with Upstream GitHub Issues**: {issues_with_github}",
             f"- **Issues without Upstream GitHub Issues**: {issues_without_github}",
             ""
-        ])
-        
-        # Add Velero 1.18 Milestone Cross-Reference
-        markdown_lines.extend(self._generate_velero_milestone_section(issues, velero_milestone_issues))
-        
-        return "\n".join(markdown_lines)
-    
-    def _load_existing_candidate_table(self) -> Dict[str, int]:
-        """Load existing candidate table and return mapping of Jira key to row number"""
-        existing_rows = {}
-        try:
-            with open(self._output_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            in_candidate_table = False
-            current_row = 1
-            
-            for line in lines:
-                # Identify candidate table section
-                if "| Row # | Jira Issue | Jira Assignee | Upstream Velero Issue(s) | Upstream Velero Issue Labels |" in line:
-                    in_candidate_table = True
-                    current_row = 1
-                    continue
-                elif line.startswith('|-------|'):
-                    continue
-                elif in_candidate_table and line.startswith('|') and '|' in line[1:]:
-                    # Parse row to extract Jira key
-                    parts = [part.strip() for part in line.split('|')]
-                    if len(parts) >= 3:
-                        # Skip if this is a header row or separator
-                        if parts[1].isdigit() or parts[1] == 'Row #':
-                            if parts[1].isdigit():
-                                # Extract Jira key from the third column (index 2)
-                                jira_part = parts[2]
-                                jira_match = re.search(r'\[([^]]+)\]', jira_part)
-                                if jira_match:
-                                    jira_key = jira_match.group(1)
-                                    existing_rows[jira_key] = int(parts[1])
-                                    current_row = max(current_row, int(parts[1]) + 1)
-                elif in_candidate_table and not line.startswith('|'):
-                    # End of candidate table
-                    break
-                    
-        except FileNotFoundError:
-            pass
-        except Exception as e:
-            print(f"Warning: Error loading existing candidate table: {e}")
-        
-        return existing_rows
-    
-    def _load_existing_milestone_table(self) -> Dict[int, int]:
-        """Load existing milestone table and return mapping of GitHub issue number to row number"""
-        existing_rows = {}
-        try:
-            with open(self._output_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            in_milestone_table = False
-            current_row = 1
-            
-            for line in lines:
-                # Identify milestone table section
-                if "| Row # | Velero Issue | Status | Labels | Associated OADP Issue(s) | Jira Assignee |" in line:
-                    in_milestone_table = True
-                    current_row = 1
-                    continue
-                elif line.startswith('|-------|'):
-                    continue
-                elif in_milestone_table and line.startswith('|') and '|' in line[1:]:
-                    # Parse row to extract GitHub issue number
-                    parts = [part.strip() for part in line.split('|')]
-                    if len(parts) >= 3:
-                        if parts[1].isdigit() or parts[1] == 'Row #':
-                            if parts[1].isdigit():
-                                # Extract GitHub issue number from the second column (index 2)
-                                velero_part = parts[2]
-                                github_match = re.search(r'#(\d+)', velero_part)
-                                if github_match:
-                                    github_number = int(github_match.group(1))
-                                    existing_rows[github_number] = int(parts[1])
-                                    current_row = max(current_row, int(parts[1]) + 1)
-                elif in_milestone_table and not line.startswith('|'):
-                    # End of milestone table
-                    break
-                    
-        except FileNotFoundError:
-            pass
-        except Exception as e:
-            print(f"Warning: Error loading existing milestone table: {e}")
+        ]
         
-        return existing_rows
+        # Add one Velero Milestone Cross-Reference per milestone
+        for milestone, milestone_issues in velero_milestone_issues.items():
+            yield from self._generate_velero_milestone_section(milestone, milestone_issues, references)
     
     def _generate_ordered_candidate_table(self, issues: List[JiraIssue], existing_table: Dict[str, int]) -> List[Tuple[int, JiraIssue]]:
         """Generate ordered table rows preserving existing row numbers and appending new ones"""
@@ -750,24 +1173,18 @@ class JiraGitHubReporter:
         
         return ordered_rows
     
-    def _generate_velero_milestone_section(self, oadp_issues: List[JiraIssue], milestone_issues: List[GitHubIssue]) -> List[str]:
-        """Generate the Velero 1.18 milestone cross-reference section"""
-        
-        # Create a mapping of GitHub issue numbers to OADP issues
-        github_to_oadp = {}
-        for oadp_issue in oadp_issues:
-            for gh_issue in oadp_issue.github_issues:
-                if gh_issue.number not in github_to_oadp:
-                    github_to_oadp[gh_issue.number] = []
-                github_to_oadp[gh_issue.number].append(oadp_issue)
+    def _generate_velero_milestone_section(self, milestone: str, milestone_issues: List[GitHubIssue],
+                                           references: GitHubReferenceIndex) -> Iterator[str]:
+        """Yield the lines of one Velero milestone's cross-reference section"""
         
-        # Load existing milestone table to preserve order and row numbers
-        existing_milestone_table = self._load_existing_milestone_table()
+        # Existing row numbers preserve the order of the previous report
+        existing_milestone_table = self._report_model.milestone_rows.get(milestone, {}) if self._report_model else {}
+        milestone_url = f"https://github.com/vmware-tanzu/velero/issues?q=is%3Aissue%20milestone%3A{quote(milestone)}"
         
-        markdown_lines = [
-            "## Velero v1.18 Milestone Issues Cross-Reference",
+        yield from [
+            f"## Velero {milestone} Milestone Issues Cross-Reference",
             "",
-            "This section lists all issues in the [Velero v1.18 milestone](https://github.com/vmware-tanzu/velero/issues?q=is%3Aissue%20milestone%3Av1.18) and identifies which ones are also referenced by OADP issues above.",
+            f"This section lists all issues in the [Velero {milestone} milestone]({milestone_url}) and identifies which ones are also referenced by OADP issues above.",
             "",
             "| Row # | Velero Issue | Status | Labels | Associated OADP Issue(s) | Jira Assignee |",
             "|-------|--------------|--------|--------|-------------------------|---------------|"
@@ -777,63 +1194,97 @@ class JiraGitHubReporter:
         
         # Generate ordered milestone table with row numbers
         ordered_milestone_rows = self._generate_ordered_milestone_table(milestone_issues, existing_milestone_table)
+        self._milestone_row_numbers[milestone] = {issue.number: row_num for row_num, issue in ordered_milestone_rows}
         
         for row_num, milestone_issue in ordered_milestone_rows:
-            # Format Velero issue cell
-            state_info = f" ({milestone_issue.state})"
-            velero_cell = f"[#{milestone_issue.number}]({milestone_issue.url}) - {milestone_issue.title}{state_info}"
-            
-            # Apply formatting for closed issues (GitHub markdown doesn't support custom colors)
-            if milestone_issue.state.lower() == "closed":
-                velero_cell = f"✅ **{velero_cell}**"
-            
-            # Format status cell
-            status_cell = milestone_issue.state.capitalize()
-            
-            # Format labels cell
-            if milestone_issue.labels:
-                labels_cell = ", ".join(milestone_issue.labels[:5])  # Limit to first 5 labels
-                if len(milestone_issue.labels) > 5:
-                    labels_cell += f" (+{len(milestone_issue.labels) - 5} more)"
-            else:
-                labels_cell = "*No labels*"
-            
             # Check if this milestone issue is referenced by any OADP issue
-            if milestone_issue.number in github_to_oadp:
-                oadp_refs = github_to_oadp[milestone_issue.number]
-                oadp_parts = []
-                assignee_parts = []
-                for oadp_issue in oadp_refs:
-                    oadp_parts.append(f"[{oadp_issue.key}]({oadp_issue.url})")
-                    assignee_parts.append(oadp_issue.assignee)
-                oadp_cell = "<br>".join(oadp_parts)
-                # Remove duplicates but preserve order
-                unique_assignees = []
-                seen = set()
-                for assignee in assignee_parts:
-                    if assignee not in seen:
-                        unique_assignees.append(assignee)
-                        seen.add(assignee)
-                assignee_cell = "<br>".join(unique_assignees)
+            reference = references.get(milestone_issue.number)
+            if reference:
                 matched_issues += 1
-            else:
-                oadp_cell = "*Not referenced by OADP issues*"
-                assignee_cell = "*N/A*"
             
-            markdown_lines.append(f"| {row_num} | {velero_cell} | {status_cell} | {labels_cell} | {oadp_cell} | {assignee_cell} |")
+            key = f'#{milestone_issue.number}'
+            row_hash = self._row_hash(key, [[issue.key, issue.url, issue.assignee]
+                                            for issue in (reference.issues if reference else [])])
+            cells = self._row_cells(key, row_hash, lambda: self._format_milestone_cells(milestone_issue, reference))
+            yield f"| {row_num} | {cells}"
         
         # Add milestone summary
-        markdown_lines.extend([
+        yield from [
             "",
-            "### Velero v1.18 Milestone Summary",
+            f"### Velero {milestone} Milestone Summary",
             "",
-            f"- **Total Velero v1.18 Issues**: {len(milestone_issues)}",
+            f"- **Total Velero {milestone} Issues**: {len(milestone_issues)}",
             f"- **Issues Referenced by OADP**: {matched_issues}",
             f"- **Issues Not Referenced by OADP**: {len(milestone_issues) - matched_issues}",
             ""
-        ])
+        ]
+    
+    def _format_candidate_cells(self, issue: JiraIssue) -> str:
+        """Cells of a candidate table row after the Row # column"""
+        # Format Jira issue cell
+        jira_cell = f"[{issue.key}]({issue.url}) - {issue.summary}"
+        
+        # Format GitHub issues cell
+        if issue.github_issues:
+            github_parts = []
+            for gh_issue in issue.github_issues:
+                state_info = f" ({gh_issue.state})"
+                github_link_text = f"[#{gh_issue.number}]({gh_issue.url}) - {gh_issue.title}{state_info}"
+                
+                # Apply formatting for closed issues (GitHub markdown doesn't support custom colors)
+                if gh_issue.state.lower() == "closed":
+                    github_link_text = f"✅ **{github_link_text}**"
+                
+                github_parts.append(github_link_text)
+            github_cell = "<br>".join(github_parts)
+        else:
+            github_cell = "*No upstream GitHub issue found*"
+        
+        # Format labels cell
+        if issue.github_issues:
+            label_parts = []
+            for gh_issue in issue.github_issues:
+                if gh_issue.labels:
+                    labels_str = ", ".join(gh_issue.labels)
+                    label_parts.append(f"**#{gh_issue.number}**: {labels_str}")
+                else:
+                    label_parts.append(f"**#{gh_issue.number}**: *No labels*")
+            labels_cell = "<br>".join(label_parts) if label_parts else "*N/A*"
+        else:
+            labels_cell = "*N/A*"
         
-        return markdown_lines
+        return f"{jira_cell} | {issue.assignee} | {github_cell} | {labels_cell} |"
+    
+    def _format_milestone_cells(self, milestone_issue: GitHubIssue, reference: Optional[GitHubReference]) -> str:
+        """Cells of a milestone cross-reference row after the Row # column"""
+        # Format Velero issue cell
+        state_info = f" ({milestone_issue.state})"
+        velero_cell = f"[#{milestone_issue.number}]({milestone_issue.url}) - {milestone_issue.title}{state_info}"
+        
+        # Apply formatting for closed issues (GitHub markdown doesn't support custom colors)
+        if milestone_issue.state.lower() == "closed":
+            velero_cell = f"✅ **{velero_cell}**"
+        
+        # Format status cell
+        status_cell = milestone_issue.state.capitalize()
+        
+        # Format labels cell
+        if milestone_issue.labels:
+            labels_cell = ", ".join(milestone_issue.labels[:5])  # Limit to first 5 labels
+            if len(milestone_issue.labels) > 5:
+                labels_cell += f" (+{len(milestone_issue.labels) - 5} more)"
+        else:
+            labels_cell = "*No labels*"
+        
+        # Check if this milestone issue is referenced by any OADP issue
+        if reference:
+            oadp_cell = "<br>".join(reference.links)
+            assignee_cell = "<br>".join(reference.assignees)
+        else:
+            oadp_cell = "*Not referenced by OADP issues*"
+            assignee_cell = "*N/A*"
+        
+        return f"{velero_cell} | {status_cell} | {labels_cell} | {oadp_cell} | {assignee_cell} |"
     
     def _generate_migtools_section(self, migtools_issues: List[str], github_org: str, github_project_num: int) -> List[str]:
         """Generate the GitHub project section"""
@@ -894,6 +1345,12 @@ Examples:
   %(prog)s --output my_report.md
   %(prog)s --jql "project = OADP AND status != Closed"
   %(prog)s --dry-run
+  %(prog)s --workers 16
+  %(prog)s --refresh
+  %(prog)s --no-graphql
+  %(prog)s --incremental
+  %(prog)s --full-issue-details
+  %(prog)s --fix-version "OADP 1.6.0" --fix-version "OADP 1.5.4" --milestone v1.18 --milestone v1.16.2
   
 Environment Variables:
   JIRA_EMAIL              Required: Jira account email (e.g. user@redhat.com)
@@ -910,12 +1367,27 @@ Environment Variables:
     
     parser.add_argument(
         '--jql',
-        default=('project = OADP AND status not in (Closed) AND '
-                 '(fixVersion = "OADP 1.6.0" OR fixVersion = "OADP 1.6.0") AND '
-                 '(labels = oadp_upstream_bug_fix ) ORDER BY priority DESC, Rank ASC'),
+        default=None,
         help='Custom JQL query to search for Jira issues'
     )
     
+    parser.add_argument(
+        '--fix-version',
+        action='append',
+        dest='fix_versions',
+        metavar='VERSION',
+        help='OADP fixVersion to include in the default query (repeatable, e.g. "OADP 1.5.4"); '
+             'cannot be combined with --jql'
+    )
+    
+    parser.add_argument(
+        '--milestone',
+        action='append',
+        dest='milestones',
+        metavar='MILESTONE',
+        help=f'Velero milestone to cross-reference (repeatable; default: {", ".join(DEFAULT_MILESTONES)})'
+    )
+    
     
     parser.add_argument(
         '--check-duplicates',
@@ -930,6 +1402,72 @@ Environment Variables:
         help='Disable duplicate content checking (overwrite all content)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Number of concurrent Jira/GitHub lookups (default: {DEFAULT_WORKERS})'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not use the on-disk GitHub response cache'
+    )
+    
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Re-download all GitHub responses and refresh the cache'
+    )
+    
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=DEFAULT_TTL_SECONDS / 3600,
+        help=f'Hours before a cached GitHub response is evicted (default: {DEFAULT_TTL_SECONDS // 3600})'
+    )
+    
+    parser.add_argument(
+        '--cache-max-mb',
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help=f'Maximum size of the GitHub response cache in MB (default: {DEFAULT_MAX_BYTES // (1024 * 1024)})'
+    )
+    
+    parser.add_argument(
+        '--no-graphql',
+        action='store_true',
+        help='Fetch GitHub issues one REST request at a time instead of batched GraphQL queries'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only fetch Jira issues updated since the last run and merge them into the local store'
+    )
+    
+    parser.add_argument(
+        '--full-issue-details',
+        action='store_true',
+        help='Fetch every Jira field and the embedded changelog for each issue '
+             'instead of reusing the search results'
+    )
+    
+    parser.add_argument(
+        '--milestone-source',
+        choices=MILESTONE_SOURCES,
+        default='search',
+        help='List Velero milestone issues with the search API (default) or the repository '
+             'issues endpoint, which has a higher rate limit'
+    )
+    
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rewrite the report even when nothing in it changed since the last run'
+    )
+    
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -938,6 +1476,14 @@ Environment Variables:
     
     args = parser.parse_args()
     
+    if args.jql and args.fix_versions:
+        parser.error('--fix-version cannot be combined with --jql')
+    if args.fix_versions:
+        args.jql = build_jql(args.fix_versions)
+    elif not args.jql:
+        args.jql = DEFAULT_JQL
+    args.milestones = list(dict.fromkeys(args.milestones or DEFAULT_MILESTONES))
+    
     jira_email = os.getenv('JIRA_EMAIL')
     jira_token = os.getenv('JIRA_NEW_TOKEN')
     github_token = os.getenv('GITHUB_TOKEN')
@@ -958,22 +1504,33 @@ Environment Variables:
         print("Configuration:")
         print(f"  Output file: {args.output}")
         print(f"  JQL query: {args.jql}")
+        print(f"  Velero milestones: {', '.join(args.milestones)}")
+        print(f"  Workers: {args.workers}")
+        print(f"  GitHub cache: {'disabled' if args.no_cache else os.path.join(CACHE_DIR, 'github.sqlite3')}")
         print(f"  Jira email: {jira_email}")
         print(f"  Jira token: {'✓ Set' if jira_token else '✗ Not set'}")
         print(f"  GitHub token: {'✓ Set' if github_token else '✗ Not set'}")
         return
     
     try:
-        # Create reporter and generate report
-        reporter = JiraGitHubReporter(jira_email, jira_token, github_token)
-        os.makedirs(os.path.dirname(args.output), exist_ok=True)
-        markdown_content = reporter.generate_report(args.jql, output_file=args.output)
-        
-        # Write to file
-        with open(args.output, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        github_cache = None
+        if not args.no_cache:
+            github_cache = ResponseCache(
+                os.path.join(CACHE_DIR, 'github.sqlite3'),
+                ttl=args.cache_ttl * 3600,
+                max_bytes=args.cache_max_mb * 1024 * 1024,
+                refresh=args.refresh
+            )
         
-        print(f"\nReport generated successfully: {args.output}")
+        # Create reporter and generate report
+        reporter = JiraGitHubReporter(jira_email, jira_token, github_token, max_workers=args.workers,
+                                      github_cache=github_cache, use_graphql=not args.no_graphql,
+                                      jira_store_dir=os.path.join(CACHE_DIR, 'jira') if args.incremental else None,
+                                      lean_issue_details=not args.full_issue_details,
+                                      milestone_source=args.milestone_source,
+                                      milestones=args.milestones)
+        if reporter.write_report(args.jql, output_file=args.output, force=args.force):
+            print(f"\nReport generated successfully: {args.output}")
         
     except requests.exceptions.RequestException as e:
         print(f"Error making API request: {e}")
@@ -10,22 +10,37 @@ import json
 import os
 import re
 import sys
+import time
 import urllib.request
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
+from rate_limit import RequestScheduler
+from report_writer import atomic_write_text
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.dirname(SCRIPT_DIR)
 OUTPUT_DIR = os.path.join(REPO_ROOT, "output")
+KONVEYOR_TAG_INDEX = os.path.join(OUTPUT_DIR, ".cache", "konveyor-builder-index.json")
 
 BUILDROOTS_URL = "https://dbenoit.pages.redhat.com/grid/buildroots.json"
 KONVEYOR_API = "https://quay.io/api/v1/repository/konveyor/builder/tag/"
 NUM_VERSIONS = 3  # show latest N minor versions
+QUAY_PAGE_SIZE = 100
+QUAY_PREFETCH_PAGES = 4  # quay tag pages requested ahead of the one being read
+TAG_CACHE_TTL_SECONDS = 10 * 60  # use the tag index without rescanning for this long
+FULL_SCAN_INTERVAL_SECONDS = 7 * 24 * 3600  # relist every tag this often to drop deleted ones
+TAG_INDEX_VERSION = 1
+KONVEYOR_TAG_RE = re.compile(r"^(?:(ubi\d+)-)?v(\d+)\.(\d+)\.(\d+)$")
+
+# Paces requests per host and retries 429/5xx responses with backoff
+SCHEDULER = RequestScheduler()
 
 
 def fetch_json(url):
     req = urllib.request.Request(url, headers={"User-Agent": "golang-build-tracker/1.0"})
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        return json.loads(resp.read())
+    return json.loads(SCHEDULER.urlopen(req, timeout=15))
 
 
 def fetch_rhel_by_minor():
@@ -43,34 +58,152 @@ def fetch_rhel_by_minor():
     return by_minor
 
 
-def fetch_konveyor_by_minor():
-    """Return dict of { 25: [entries...], ... } from quay.io Konveyor builder tags."""
-    page, all_tags = 1, []
-    while True:
-        data = fetch_json(f"{KONVEYOR_API}?limit=100&onlyActiveTags=true&page={page}")
-        tags = data.get("tags", [])
-        if not tags:
-            break
-        all_tags.extend(tags)
-        if not data.get("has_additional"):
-            break
-        page += 1
-
-    ver_re = re.compile(r"^(?:(ubi\d+)-)?v(\d+)\.(\d+)\.(\d+)$")
+def konveyor_page_url(page):
+    return f"{KONVEYOR_API}?limit={QUAY_PAGE_SIZE}&onlyActiveTags=true&page={page}"
+
+
+def iter_konveyor_tag_pages(prefetch=QUAY_PREFETCH_PAGES):
+    """Yield the active tags page by page, keeping `prefetch` page requests in flight.
+
+    quay.io lists tags newest first and only reports `has_additional`, so pages
+    past the end are requested speculatively; their (empty) results are discarded.
+    Callers may stop iterating early, leaving the remaining pages unread.
+    """
+    with ThreadPoolExecutor(max_workers=prefetch) as pool:
+        pending = deque(pool.submit(fetch_json, konveyor_page_url(page)) for page in range(1, prefetch + 1))
+        next_page = prefetch + 1
+        try:
+            while pending:
+                data = pending.popleft().result()
+                tags = data.get("tags", [])
+                if not tags:
+                    break
+                yield tags
+                if not data.get("has_additional"):
+                    break
+                pending.append(pool.submit(fetch_json, konveyor_page_url(next_page)))
+                next_page += 1
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def tag_timestamp(tag):
+    """Seconds since the epoch at which a tag was pushed, or 0 when quay does not say."""
+    if tag.get("start_ts") is not None:
+        return float(tag["start_ts"])
+    try:
+        return parsedate_to_datetime(tag["last_modified"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return 0.0
+
+
+def parse_konveyor_tag(tag):
+    """Return the table entry for a versioned builder tag, or None for other tags."""
+    m = KONVEYOR_TAG_RE.match(tag["name"])
+    if not m:
+        return None
+    ubi = m.group(1)
+    major, minor, patch = int(m.group(2)), int(m.group(3)), int(m.group(4))
+    return {
+        "tag": tag["name"],
+        "version": f"{major}.{minor}.{patch}",
+        "ubi": ubi or "ubi9",
+        "modified": tag.get("last_modified", "N/A"),
+        "sort_key": (major, minor, patch, ubi or ""),
+    }
+
+
+def load_tag_index(path):
+    """Return the persisted tag index, or None when it is missing, unreadable or stale in format."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        print(f"Warning: ignoring unreadable tag index {path}: {exc}", file=sys.stderr)
+        return None
+    if data.get("version") != TAG_INDEX_VERSION or data.get("url") != konveyor_page_url(1):
+        return None
+    entries = {}
+    for minor_entries in data["minors"].values():
+        for entry in minor_entries:
+            entry["sort_key"] = tuple(entry["sort_key"])
+            entries[entry["tag"]] = entry
+    return {
+        "scanned_at": data["scanned_at"],
+        "full_scan_at": data["full_scan_at"],
+        "watermark": data["watermark"],
+        "entries": entries,
+    }
+
+
+def save_tag_index(path, index):
+    minors = defaultdict(list)
+    for entry in index["entries"].values():
+        minors[entry["sort_key"][1]].append(entry)
+    atomic_write_text(path, json.dumps({
+        "version": TAG_INDEX_VERSION,
+        "url": konveyor_page_url(1),
+        "scanned_at": index["scanned_at"],
+        "full_scan_at": index["full_scan_at"],
+        "watermark": index["watermark"],
+        "minors": {str(minor): entries for minor, entries in sorted(minors.items())},
+    }))
+
+
+def scan_konveyor_tags(index, now, full):
+    """Merge tags pushed since the index watermark (or every tag when full) into index."""
+    if full:
+        index.update(full_scan_at=now, watermark=0.0, entries={})
+    watermark = index["watermark"]
+    newest, scanned = watermark, 0
+    # An incremental scan usually stops after the first page, so only prefetch for full scans
+    pages = iter_konveyor_tag_pages(QUAY_PREFETCH_PAGES if full else 1)
+    try:
+        for tags in pages:
+            scanned += len(tags)
+            timestamps = [tag_timestamp(tag) for tag in tags]
+            for tag, pushed_at in zip(tags, timestamps):
+                newest = max(newest, pushed_at)
+                entry = parse_konveyor_tag(tag)
+                if entry:
+                    # Re-pushed tags replace their previous entry
+                    index["entries"][entry["tag"]] = entry
+            if not full and min(timestamps) < watermark:
+                break
+    finally:
+        pages.close()
+    index.update(scanned_at=now, watermark=newest)
+    mode = "full" if full else "incremental"
+    print(f"Konveyor tags: {mode} scan read {scanned} tags, {len(index['entries'])} indexed", file=sys.stderr)
+
+
+def fetch_konveyor_by_minor(index_path=KONVEYOR_TAG_INDEX, cache_ttl=TAG_CACHE_TTL_SECONDS, rescan=False):
+    """Return dict of { 25: [entries...], ... } from quay.io Konveyor builder tags.
+
+    Versioned tags are kept in a per-minor index at index_path together with the
+    newest push time seen. Later runs only read the newest pages, down to the first
+    tag older than that watermark; every FULL_SCAN_INTERVAL_SECONDS (or with
+    rescan) the whole listing is read again to drop deleted tags. An index scanned
+    less than cache_ttl seconds ago is used without contacting quay.io at all.
+    """
+    now = time.time()
+    index = None if rescan else load_tag_index(index_path)
+    if index and 0 <= now - index["scanned_at"] < cache_ttl:
+        age = now - index["scanned_at"]
+        print(f"Konveyor tags: {len(index['entries'])} indexed, scanned {age:.0f}s ago", file=sys.stderr)
+    else:
+        full = index is None or not 0 <= now - index["full_scan_at"] < FULL_SCAN_INTERVAL_SECONDS
+        if index is None:
+            index = {}
+        scan_konveyor_tags(index, now, full)
+        save_tag_index(index_path, index)
+
     by_minor = defaultdict(list)
-    for tag in all_tags:
-        m = ver_re.match(tag["name"])
-        if not m:
-            continue
-        ubi = m.group(1)
-        major, minor, patch = int(m.group(2)), int(m.group(3)), int(m.group(4))
-        by_minor[minor].append({
-            "tag": tag["name"],
-            "version": f"{major}.{minor}.{patch}",
-            "ubi": ubi or "ubi9",
-            "modified": tag.get("last_modified", "N/A"),
-            "sort_key": (major, minor, patch, ubi or ""),
-        })
+    for entry in index["entries"].values():
+        by_minor[entry["sort_key"][1]].append(entry)
     return by_minor
 
 
@@ -112,18 +245,28 @@ def main():
     parser.add_argument("--output", "-o",
                         default=os.path.join(OUTPUT_DIR, "golang-builders.md"),
                         help="output markdown file (default: output/golang-builders.md)")
+    parser.add_argument("--tag-cache-ttl", type=int, default=TAG_CACHE_TTL_SECONDS, metavar="SECONDS",
+                        help="use the quay.io tag index in output/.cache without rescanning for this many "
+                             f"seconds (default: {TAG_CACHE_TTL_SECONDS}; 0 always scans for new tags)")
+    parser.add_argument("--rescan", action="store_true",
+                        help="list every quay.io tag again instead of only those newer than the index")
     args = parser.parse_args()
 
     errors = []
 
+    # Both sources are independent, so fetch them side by side
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        rhel_future = pool.submit(fetch_rhel_by_minor)
+        konveyor_future = pool.submit(fetch_konveyor_by_minor, cache_ttl=args.tag_cache_ttl, rescan=args.rescan)
+
     try:
-        rhel = fetch_rhel_by_minor()
+        rhel = rhel_future.result()
     except Exception as exc:
         errors.append(f"RHEL buildroots: {exc}")
         rhel = {}
 
     try:
-        konveyor = fetch_konveyor_by_minor()
+        konveyor = konveyor_future.result()
     except Exception as exc:
         errors.append(f"Konveyor tags: {exc}")
         konveyor = {}
@@ -179,6 +322,7 @@ def main():
     with open(args.output, "w") as f:
         f.write(content)
     print(f"Wrote {args.output}", file=sys.stderr)
+    print(f"Request scheduler:\n{SCHEDULER.summary()}", file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -11,29 +11,38 @@ Usage:
     python3 get_oadp_bugs.py --version "OADP 1.5.0"
     python3 get_oadp_bugs.py -o oadp-1.6.0-bugs.md   # write to file
     python3 get_oadp_bugs.py --qe                     # QE report: ON_QA/VERIFIED grouped by QA Contact
+    python3 get_oadp_bugs.py --incremental            # only pull issues updated since the last run
+    python3 get_oadp_bugs.py --batch -v "OADP 1.5.4" -v "OADP 1.6.0"   # bugs + QE reports, one query
 """
 
 import argparse
-import base64
-import json
 import os
 import sys
-import urllib.parse
-import urllib.request
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import attrgetter
+
+from jira_client import JIRA_SITE, JiraClient, env_auth, netrc_auth, resolve_auth_header
+from jira_store import JiraIssueStore
+from report_writer import MarkdownWriter
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.dirname(SCRIPT_DIR)
 OUTPUT_DIR = os.path.join(REPO_ROOT, "output")
+JIRA_STORE_DIR = os.path.join(OUTPUT_DIR, ".cache", "jira")
 
-JIRA_SITE = "redhat.atlassian.net"
-API_BASE = f"https://{JIRA_SITE}/rest/api/3"
 DEFAULT_VERSION = "OADP 1.6.0"
 EXCLUDED_STATUSES = ("MODIFIED", "Closed", "ON_QA", "Dev Complete", "Verified")
 QE_STATUSES = ("ON_QA", "Testing")
 QA_CONTACT_FIELD = "customfield_10470"
 PAGE_SIZE = 100
+# Parent keys per `parent in (...)` subtask query, and how many of those queries run at once
+CHILD_QUERY_CHUNK_SIZE = 50
+CHILD_QUERY_WORKERS = 4
+ISSUE_FIELDS = "summary,status,priority,created,labels,assignee,issuetype"
+# --batch needs the QA contact for the QE views and fixVersions to split results by version
+BATCH_EXTRA_FIELDS = [QA_CONTACT_FIELD, "fixVersions"]
 
 PRIORITY_ORDER = {
     "Blocker": 0, "Critical": 1, "Major": 2, "Normal": 3,
@@ -42,20 +51,9 @@ PRIORITY_ORDER = {
 
 
 def get_auth_header():
-    email = os.environ.get("JIRA_EMAIL", "")
-    token = os.environ.get("JIRA_API_TOKEN", "")
-    if email and token:
-        creds = base64.b64encode(f"{email}:{token}".encode()).decode()
-        return f"Basic {creds}"
-
-    try:
-        import netrc
-        auth = netrc.netrc().authenticators(JIRA_SITE)
-        if auth:
-            creds = base64.b64encode(f"{auth[0]}:{auth[2]}".encode()).decode()
-            return f"Basic {creds}"
-    except Exception:
-        pass
+    auth = resolve_auth_header([env_auth("JIRA_EMAIL", "JIRA_API_TOKEN"), netrc_auth(JIRA_SITE)])
+    if auth:
+        return auth
 
     print(
         "ERROR: Set JIRA_EMAIL + JIRA_API_TOKEN env vars, or add a ~/.netrc entry for "
@@ -65,74 +63,44 @@ def get_auth_header():
     sys.exit(1)
 
 
-def jira_search(jql, auth_header, extra_fields=None):
-    """Return all matching issues, handling pagination via nextPageToken."""
-    issues = []
-    fields = "summary,status,priority,created,labels,assignee,issuetype"
+def search_fields(extra_fields=None):
+    fields = ISSUE_FIELDS
     if extra_fields:
         fields += "," + ",".join(extra_fields)
-    next_token = None
-    while True:
-        params = {"jql": jql, "maxResults": PAGE_SIZE, "fields": fields}
-        if next_token:
-            params["nextPageToken"] = next_token
-        qs = urllib.parse.urlencode(params)
-        req = urllib.request.Request(
-            f"{API_BASE}/search/jql?{qs}",
-            headers={
-                "Authorization": auth_header,
-                "Accept": "application/json",
-            },
-        )
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read())
-        issues.extend(data["issues"])
-        if data.get("isLast", True):
-            break
-        next_token = data.get("nextPageToken")
-        if not next_token:
-            break
+    return fields
+
+
+def jira_search(jql, client, extra_fields=None):
+    """Return all matching issues, handling pagination via nextPageToken."""
+    issues = client.search(jql, search_fields(extra_fields), page_size=PAGE_SIZE)
     return issues, len(issues)
 
 
-def fetch_child_issues(parent_keys, auth_header):
+def fetch_child_issues(parent_keys, client, chunk_size=CHILD_QUERY_CHUNK_SIZE):
     """Fetch subtasks/child issues for a list of parent issue keys.
 
+    Parents are queried in chunks of ``chunk_size`` keys, with the chunk queries
+    running concurrently; JiraClient.search sends long clauses as POST requests.
+
     Returns a dict mapping parent key -> list of child issue dicts.
     """
     if not parent_keys:
         return {}
-    keys_str = ", ".join(parent_keys)
-    jql = f"parent in ({keys_str}) ORDER BY created ASC"
-    issues = []
     fields = "summary,status,assignee,issuetype,parent"
-    next_token = None
-    while True:
-        params = {"jql": jql, "maxResults": PAGE_SIZE, "fields": fields}
-        if next_token:
-            params["nextPageToken"] = next_token
-        qs = urllib.parse.urlencode(params)
-        req = urllib.request.Request(
-            f"{API_BASE}/search/jql?{qs}",
-            headers={
-                "Authorization": auth_header,
-                "Accept": "application/json",
-            },
-        )
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read())
-        issues.extend(data["issues"])
-        if data.get("isLast", True):
-            break
-        next_token = data.get("nextPageToken")
-        if not next_token:
-            break
+    chunks = [parent_keys[i:i + chunk_size] for i in range(0, len(parent_keys), chunk_size)]
+
+    def search_chunk(keys):
+        jql = f"parent in ({', '.join(keys)}) ORDER BY created ASC"
+        return client.search(jql, fields, page_size=PAGE_SIZE)
 
     by_parent = defaultdict(list)
-    for issue in issues:
-        parent_key = (issue["fields"].get("parent") or {}).get("key")
-        if parent_key:
-            by_parent[parent_key].append(issue)
+    with ThreadPoolExecutor(max_workers=CHILD_QUERY_WORKERS) as pool:
+        # Each parent's children come from a single chunk, so merging in chunk order keeps them sorted
+        for issues in pool.map(search_chunk, chunks):
+            for issue in issues:
+                parent_key = (issue["fields"].get("parent") or {}).get("key")
+                if parent_key:
+                    by_parent[parent_key].append(issue)
     return dict(by_parent)
 
 
@@ -172,16 +140,105 @@ def build_qe_jql(version, statuses=QE_STATUSES, issue_types=ISSUE_TYPES):
     )
 
 
+def build_batch_jql(versions, issue_types=ISSUE_TYPES):
+    """One query covering the bugs and QE reports of every version; see partition_issues"""
+    version_list = ", ".join(f'"{v}"' for v in versions)
+    types = ", ".join(issue_types)
+    excluded = ", ".join(f'"{s}"' for s in EXCLUDED_STATUSES)
+    story_statuses = ", ".join(f'"{s}"' for s in STORY_STATUSES)
+    qe_statuses = ", ".join(f'"{s}"' for s in QE_STATUSES)
+    return (
+        f"project = OADP AND fixVersion in ({version_list}) AND issuetype in ({types}) "
+        f"AND (status in ({qe_statuses}) "
+        f"OR (issuetype != Story AND status not in ({excluded})) "
+        f"OR (issuetype = Story AND status in ({story_statuses}))) "
+        f'AND component != "Documentation" '
+        f"ORDER BY priority DESC, created DESC"
+    )
+
+
+def partition_issues(issues, versions, issue_types=ISSUE_TYPES):
+    """Split the results of build_batch_jql into the issues of each report.
+
+    Returns a dict mapping (version, qe_mode) -> issues matching build_qe_jql(version)
+    when qe_mode is set and build_jql(version, EXCLUDED_STATUSES) otherwise, in query
+    order. Versions, types and statuses are compared casefolded, as JQL does.
+    """
+    def folded(values):
+        return {v.casefold() for v in values}
+
+    types = folded(issue_types)
+    excluded = folded(EXCLUDED_STATUSES)
+    story_statuses = folded(STORY_STATUSES)
+    qe_statuses = folded(QE_STATUSES)
+    versions_by_name = {v.casefold(): v for v in versions}
+
+    views = {(version, qe_mode): [] for version in versions for qe_mode in (False, True)}
+    for issue in issues:
+        f = issue["fields"]
+        itype = (f.get("issuetype") or {}).get("name", "").casefold()
+        if itype not in types:
+            continue
+        status = (f.get("status") or {}).get("name", "").casefold()
+        in_bugs = status in story_statuses if itype == "story" else status not in excluded
+        in_qe = status in qe_statuses
+        if not (in_bugs or in_qe):
+            continue
+        matched = {versions_by_name.get(v.get("name", "").casefold()) for v in f.get("fixVersions") or ()}
+        for version in versions:
+            if version in matched:
+                if in_bugs:
+                    views[(version, False)].append(issue)
+                if in_qe:
+                    views[(version, True)].append(issue)
+    return views
+
+
+class IssueRecord:
+    """A Jira issue reduced once to the values the report groups, sorts and renders"""
+
+    __slots__ = ("key", "summary", "issue_type", "contact", "priority", "status", "created", "labels", "sort_key")
+
+    def __init__(self, issue, group_by="assignee"):
+        f = issue["fields"]
+        self.key = issue["key"]
+        self.summary = f["summary"]
+        self.issue_type = f.get("issuetype", {}).get("name", "Other")
+        self.contact = get_contact_name(issue, group_by)
+        self.priority = f.get("priority", {}).get("name", "Undefined")
+        self.status = f.get("status", {}).get("name", "")
+        self.created = f["created"]
+        self.labels = f.get("labels", [])
+        self.sort_key = (PRIORITY_ORDER.get(self.priority, 99), self.created)
+
+    def table_row(self):
+        link = f"https://{JIRA_SITE}/browse/{self.key}"
+        labels = ", ".join(self.labels)
+        return (f"| [{self.key}]({link}) | {self.summary} | {self.priority} | {self.status} "
+                f"| {self.created[:10]} | {labels} |")
+
+
 def format_issue_row(issue):
-    f = issue["fields"]
-    key = issue["key"]
-    summary = f["summary"]
-    priority = f.get("priority", {}).get("name", "Undefined")
-    status = f.get("status", {}).get("name", "")
-    created = f["created"][:10]
-    labels = ", ".join(f.get("labels", []))
-    link = f"https://{JIRA_SITE}/browse/{key}"
-    return f"| [{key}]({link}) | {summary} | {priority} | {status} | {created} | {labels} |"
+    return IssueRecord(issue).table_row()
+
+
+def group_issues(issues, group_by="assignee"):
+    """Normalize and bucket issues in a single pass.
+
+    Returns (type_counts, by_person): issue counts per type in first-seen order,
+    and contact -> issue type -> IssueRecords sorted by priority then creation.
+    """
+    type_counts = {}
+    by_person = {}
+    for issue in issues:
+        record = IssueRecord(issue, group_by)
+        type_counts[record.issue_type] = type_counts.get(record.issue_type, 0) + 1
+        by_person.setdefault(record.contact, {}).setdefault(record.issue_type, []).append(record)
+    sort_key = attrgetter("sort_key")
+    for types in by_person.values():
+        for records in types.values():
+            records.sort(key=sort_key)
+    return type_counts, by_person
 
 
 def get_contact_name(issue, group_by="assignee"):
@@ -198,18 +255,12 @@ def get_contact_name(issue, group_by="assignee"):
     return assignee["displayName"] if assignee else "Unassigned"
 
 
-def generate_markdown(version, issues, total, qe_mode=False, subtasks_by_parent=None):
+def iter_markdown(version, issues, total, qe_mode=False, subtasks_by_parent=None):
+    """Yield the lines of the report, without trailing newlines"""
     group_by = "qa_contact" if qe_mode else "assignee"
     group_label = "QA Contact" if qe_mode else "Assignee"
 
-    by_type = defaultdict(list)
-    for issue in issues:
-        itype = issue["fields"].get("issuetype", {}).get("name", "Other")
-        by_type[itype].append(issue)
-
-    all_contacts = set()
-    for issue in issues:
-        all_contacts.add(get_contact_name(issue, group_by))
+    type_counts, by_person = group_issues(issues, group_by)
 
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
@@ -222,36 +273,29 @@ def generate_markdown(version, issues, total, qe_mode=False, subtasks_by_parent=
         jql = build_jql(version, EXCLUDED_STATUSES)
         title = f"{version} Issues (Excluding {excluded})"
 
-    lines = []
-    lines.append(f"# {title}")
-    lines.append("")
-    lines.append(f"**JQL:** `{jql}`")
-    lines.append("")
-    lines.append(f"**Total issues:** {total}  ")
-    lines.append(f"**{group_label}s:** {len(all_contacts)}  ")
-    lines.append(f"**Generated:** {now}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    yield f"# {title}"
+    yield ""
+    yield f"**JQL:** `{jql}`"
+    yield ""
+    yield f"**Total issues:** {total}  "
+    yield f"**{group_label}s:** {len(by_person)}  "
+    yield f"**Generated:** {now}"
+    yield ""
+    yield "---"
+    yield ""
 
-    type_order = sorted(by_type.keys(), key=lambda t: ISSUE_TYPE_ORDER.get(t, 99))
+    type_order = sorted(type_counts, key=lambda t: ISSUE_TYPE_ORDER.get(t, 99))
 
     def slug(text):
         return text.lower().replace(" ", "-").replace("(", "").replace(")", "")
 
-    by_person = defaultdict(lambda: defaultdict(list))
-    for issue in issues:
-        name = get_contact_name(issue, group_by)
-        itype = issue["fields"].get("issuetype", {}).get("name", "Other")
-        by_person[name][itype].append(issue)
-
-    all_names = sorted(all_contacts, key=str.lower)
-    type_headers = [f"{t}s ({len(by_type[t])})" for t in type_order]
+    all_names = sorted(by_person, key=str.lower)
+    type_headers = [f"{t}s ({type_counts[t]})" for t in type_order]
 
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"| {group_label} | " + " | ".join(type_headers) + " | Total |")
-    lines.append("|----------|" + "|".join(["-------"] * len(type_order)) + "|-------|")
+    yield "## Summary"
+    yield ""
+    yield f"| {group_label} | " + " | ".join(type_headers) + " | Total |"
+    yield "|----------|" + "|".join(["-------"] * len(type_order)) + "|-------|"
     for name in all_names:
         cols = []
         row_total = 0
@@ -264,50 +308,41 @@ def generate_markdown(version, issues, total, qe_mode=False, subtasks_by_parent=
             else:
                 cols.append("—")
         cols.append(f"**{row_total}**")
-        lines.append(f"| {name} | " + " | ".join(cols) + " |")
-    totals_row = [f"**{len(by_type[t])}**" for t in type_order]
+        yield f"| {name} | " + " | ".join(cols) + " |"
+    totals_row = [f"**{type_counts[t]}**" for t in type_order]
     totals_row.append(f"**{total}**")
-    lines.append(f"| **Total** | " + " | ".join(totals_row) + " |")
-    lines.append("")
-    lines.append("---")
+    yield f"| **Total** | " + " | ".join(totals_row) + " |"
+    yield ""
+    yield "---"
 
     subtasks_by_parent = subtasks_by_parent or {}
 
     for name in all_names:
         person_total = sum(len(v) for v in by_person[name].values())
-        lines.append("")
-        lines.append(f"# {name} ({person_total})")
+        yield ""
+        yield f"# {name} ({person_total})"
 
         for itype in type_order:
             type_issues = by_person[name].get(itype, [])
             if not type_issues:
                 continue
-            type_issues.sort(key=lambda i: (
-                PRIORITY_ORDER.get(i["fields"].get("priority", {}).get("name", "Undefined"), 99),
-                i["fields"]["created"],
-            ))
-            lines.append("")
-            lines.append(f"## {itype}s ({len(type_issues)})")
+            yield ""
+            yield f"## {itype}s ({len(type_issues)})"
 
             if qe_mode:
-                for issue in type_issues:
-                    f = issue["fields"]
-                    key = issue["key"]
-                    summary = f["summary"]
-                    priority = f.get("priority", {}).get("name", "Undefined")
-                    status = f.get("status", {}).get("name", "")
-                    link = f"https://{JIRA_SITE}/browse/{key}"
-                    lines.append("")
-                    lines.append(f"### [{key}]({link}) — {summary}")
-                    lines.append(f"**Priority:** {priority} | **Status:** {status}")
-
-                    children = subtasks_by_parent.get(key, [])
+                for record in type_issues:
+                    link = f"https://{JIRA_SITE}/browse/{record.key}"
+                    yield ""
+                    yield f"### [{record.key}]({link}) — {record.summary}"
+                    yield f"**Priority:** {record.priority} | **Status:** {record.status}"
+
+                    children = subtasks_by_parent.get(record.key, [])
                     if children:
-                        lines.append("")
-                        lines.append("**Platform Validation Tasks:**")
-                        lines.append("")
-                        lines.append("| Task | Summary | Assignee | Status |")
-                        lines.append("|------|---------|----------|--------|")
+                        yield ""
+                        yield "**Platform Validation Tasks:**"
+                        yield ""
+                        yield "| Task | Summary | Assignee | Status |"
+                        yield "|------|---------|----------|--------|"
                         for child in children:
                             cf = child["fields"]
                             ckey = child["key"]
@@ -315,62 +350,122 @@ def generate_markdown(version, issues, total, qe_mode=False, subtasks_by_parent=
                             csummary = cf.get("summary", "")
                             cassignee = (cf.get("assignee") or {}).get("displayName", "Unassigned")
                             cstatus = (cf.get("status") or {}).get("name", "")
-                            lines.append(f"| [{ckey}]({clink}) | {csummary} | {cassignee} | {cstatus} |")
+                            yield f"| [{ckey}]({clink}) | {csummary} | {cassignee} | {cstatus} |"
                     else:
-                        lines.append("")
-                        lines.append("_No subtasks found._")
+                        yield ""
+                        yield "_No subtasks found._"
             else:
-                lines.append("")
-                lines.append("| Key | Summary | Priority | Status | Created | Labels |")
-                lines.append("|-----|---------|----------|--------|---------|--------|")
-                for issue in type_issues:
-                    lines.append(format_issue_row(issue))
+                yield ""
+                yield "| Key | Summary | Priority | Status | Created | Labels |"
+                yield "|-----|---------|----------|--------|---------|--------|"
+                for record in type_issues:
+                    yield record.table_row()
+
+
+def generate_markdown(version, issues, total, qe_mode=False, subtasks_by_parent=None):
+    return "\n".join(iter_markdown(version, issues, total, qe_mode, subtasks_by_parent)) + "\n"
 
-    return "\n".join(lines) + "\n"
+
+def default_output_path(version, qe_mode=False):
+    version_slug = version.lower().replace(" ", "-")
+    suffix = "qe" if qe_mode else "bugs"
+    return os.path.join(OUTPUT_DIR, f"{version_slug}-{suffix}.md")
+
+
+def fetch_issues(jql, client, extra_fields=None, incremental=False):
+    print(f"Querying Jira: {jql}", file=sys.stderr)
+    if incremental:
+        store = JiraIssueStore.for_query(JIRA_STORE_DIR, jql, search_fields(extra_fields))
+        issues = store.sync(
+            jql,
+            lambda q: jira_search(q, client, extra_fields=extra_fields)[0],
+            client.search_keys,
+        )
+        print(f"Jira store: {store.summary()}", file=sys.stderr)
+    else:
+        issues, _ = jira_search(jql, client, extra_fields=extra_fields)
+    print(f"Found {len(issues)} issues", file=sys.stderr)
+    return issues
+
+
+def fetch_subtasks(issues, client):
+    if not issues:
+        return {}
+    parent_keys = [i["key"] for i in issues]
+    print(f"Fetching subtasks for {len(parent_keys)} issues...", file=sys.stderr)
+    subtasks_by_parent = fetch_child_issues(parent_keys, client)
+    child_count = sum(len(v) for v in subtasks_by_parent.values())
+    print(f"Found {child_count} subtasks across {len(subtasks_by_parent)} parents", file=sys.stderr)
+    return subtasks_by_parent
+
+
+def write_report(path, version, issues, qe_mode=False, subtasks_by_parent=None):
+    with MarkdownWriter(path, trailing_newline=True) as writer:
+        writer.write_lines(iter_markdown(version, issues, len(issues), qe_mode=qe_mode,
+                                         subtasks_by_parent=subtasks_by_parent))
+    print(f"Wrote {path}", file=sys.stderr)
+
+
+def run_batch(versions, client, incremental=False):
+    """Write the bugs and QE reports of every version from a single union query"""
+    issues = fetch_issues(build_batch_jql(versions), client, BATCH_EXTRA_FIELDS, incremental)
+    views = partition_issues(issues, versions)
+
+    qe_parents = {}
+    for version in versions:
+        for issue in views[(version, True)]:
+            qe_parents.setdefault(issue["key"], issue)
+    subtasks_by_parent = fetch_subtasks(list(qe_parents.values()), client)
+
+    for version in versions:
+        for qe_mode in (False, True):
+            view = views[(version, qe_mode)]
+            print(f"{version} {'QE' if qe_mode else 'bugs'}: {len(view)} issues", file=sys.stderr)
+            write_report(default_output_path(version, qe_mode), version, view, qe_mode,
+                         subtasks_by_parent if qe_mode else None)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Generate OADP bug report from Jira")
-    parser.add_argument("--version", "-v", default=DEFAULT_VERSION, help="fixVersion to query")
+    parser.add_argument("--version", "-v", action="append", dest="versions", default=None,
+                        help=f"fixVersion to query (default: {DEFAULT_VERSION}); repeat with --batch")
     parser.add_argument("--output", "-o", default=None,
                         help="output markdown file (default: output/<version>-bugs.md)")
     parser.add_argument("--qe", action="store_true",
                         help="QE report: show ON_QA/VERIFIED issues grouped by QA Contact")
+    parser.add_argument("--batch", action="store_true",
+                        help="write both the bugs and the QE report of every --version from one Jira "
+                             "query, each to its default path")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only fetch issues updated since the last run and merge them into "
+                             "the local store in output/.cache/jira")
     args = parser.parse_args()
 
-    if args.output is None:
-        version_slug = args.version.lower().replace(" ", "-")
-        suffix = "qe" if args.qe else "bugs"
-        args.output = os.path.join(OUTPUT_DIR, f"{version_slug}-{suffix}.md")
+    versions = list(dict.fromkeys(args.versions or [DEFAULT_VERSION]))
+    if args.batch and (args.output or args.qe):
+        parser.error("--batch writes every report to its default path and cannot be combined with "
+                     "--output or --qe")
+    if not args.batch and len(versions) > 1:
+        parser.error("several --version values need --batch")
 
-    auth = get_auth_header()
-    extra_fields = None
+    client = JiraClient(get_auth_header())
 
-    if args.qe:
-        jql = build_qe_jql(args.version)
-        extra_fields = [QA_CONTACT_FIELD]
+    if args.batch:
+        run_batch(versions, client, incremental=args.incremental)
     else:
-        jql = build_jql(args.version, EXCLUDED_STATUSES)
-
-    print(f"Querying Jira: {jql}", file=sys.stderr)
-    issues, total = jira_search(jql, auth, extra_fields=extra_fields)
-    print(f"Found {total} issues", file=sys.stderr)
-
-    subtasks_by_parent = {}
-    if args.qe and issues:
-        parent_keys = [i["key"] for i in issues]
-        print(f"Fetching subtasks for {len(parent_keys)} issues...", file=sys.stderr)
-        subtasks_by_parent = fetch_child_issues(parent_keys, auth)
-        child_count = sum(len(v) for v in subtasks_by_parent.values())
-        print(f"Found {child_count} subtasks across {len(subtasks_by_parent)} parents", file=sys.stderr)
-
-    md = generate_markdown(args.version, issues, total, qe_mode=args.qe,
-                           subtasks_by_parent=subtasks_by_parent)
-
-    os.makedirs(os.path.dirname(args.output), exist_ok=True)
-    with open(args.output, "w") as f:
-        f.write(md)
-    print(f"Wrote {args.output}", file=sys.stderr)
+        version = versions[0]
+        if args.output is None:
+            args.output = default_output_path(version, args.qe)
+
+        if args.qe:
+            issues = fetch_issues(build_qe_jql(version), client, [QA_CONTACT_FIELD], args.incremental)
+            subtasks_by_parent = fetch_subtasks(issues, client)
+        else:
+            issues = fetch_issues(build_jql(version, EXCLUDED_STATUSES), client, None, args.incremental)
+            subtasks_by_parent = {}
+        write_report(args.output, version, issues, args.qe, subtasks_by_parent)
+
+    print(f"Request scheduler:\n{client.scheduler.summary()}", file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Persistent HTTP response cache for GitHub API calls.
+
+Responses are stored in SQLite keyed by the full request URL together with
+their ETag/Last-Modified validators. Later requests for the same URL are sent
+as conditional requests, and a 304 Not Modified answer is served from disk.
+GitHub does not count 304 responses against the API rate limit.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ResponseCache:
+    """SQLite-backed cache of JSON GET responses with conditional revalidation"""
+
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL_SECONDS,
+                 max_bytes: int = DEFAULT_MAX_BYTES, refresh: bool = False):
+        """
+        Args:
+            path: SQLite database file (parent directories are created)
+            ttl: Seconds after which an entry is evicted and fetched unconditionally
+            max_bytes: Total body size above which least recently used entries are evicted
+            refresh: Ignore stored validators and re-download everything (results are still stored)
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self.stats = {'revalidated': 0, 'fetched': 0, 'evicted': 0}
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " url TEXT PRIMARY KEY,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " body TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._expire()
+
+    def get_json(self, session: requests.Session, url: str, params: Optional[Dict] = None):
+        """
+        GET a URL through the cache and return the decoded JSON body.
+
+        Raises requests.exceptions.RequestException on transport or HTTP errors,
+        exactly like an uncached ``session.get(...).raise_for_status()``.
+        """
+        key = requests.Request('GET', url, params=params).prepare().url
+        entry = None if self.refresh else self._lookup(key)
+
+        headers = {}
+        if entry:
+            etag, last_modified, _ = entry
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        response = session.get(key, headers=headers)
+        if response.status_code == 304 and entry:
+            self._touch(key)
+            with self._lock:
+                self.stats['revalidated'] += 1
+            return json.loads(entry[2])
+
+        response.raise_for_status()
+        data = response.json()
+        self._store(key, response.headers.get('ETag'), response.headers.get('Last-Modified'), response.text)
+        with self._lock:
+            self.stats['fetched'] += 1
+        return data
+
+    def summary(self) -> str:
+        """One-line description of cache activity for the run"""
+        return (f"{self.stats['revalidated']} served from cache (304), "
+                f"{self.stats['fetched']} downloaded, {self.stats['evicted']} evicted")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _lookup(self, key: str):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT etag, last_modified, body FROM responses WHERE url = ? AND stored_at >= ?",
+                (key, time.time() - self.ttl)
+            ).fetchone()
+
+    def _touch(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), key))
+            self._conn.commit()
+
+    def _store(self, key: str, etag: Optional[str], last_modified: Optional[str], body: str) -> None:
+        if not etag and not last_modified:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, etag, last_modified, body, size, stored_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, etag, last_modified, body, len(body), now, now)
+            )
+            self._evict_to_size()
+            self._conn.commit()
+
+    def _expire(self) -> None:
+        """Drop entries older than the TTL"""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM responses WHERE stored_at < ?", (time.time() - self.ttl,))
+            self.stats['evicted'] += cursor.rowcount
+            self._conn.commit()
+
+    def _evict_to_size(self) -> None:
+        """Evict least recently used entries until the cache fits in max_bytes (caller holds the lock)"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, size in self._conn.execute(
+                "SELECT url, size FROM responses ORDER BY accessed_at ASC").fetchall():
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self.stats['evicted'] += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
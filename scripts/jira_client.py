@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Shared Jira Cloud REST client for the OADP report scripts.
+
+One pooled, keep-alive requests.Session per client (gzip is negotiated by
+requests), configurable timeouts, pluggable authentication and a single
+paginator for endpoints that page with nextPageToken. Requests are paced and
+retried by a rate_limit.RequestScheduler.
+"""
+
+import base64
+import os
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+import requests
+
+from rate_limit import RateLimitedAdapter, RequestScheduler
+
+JIRA_SITE = "redhat.atlassian.net"
+DEFAULT_TIMEOUT = (10, 60)  # (connect, read) seconds
+DEFAULT_POOL_SIZE = 8
+SEARCH_PAGE_SIZE = 100
+# /search/jql allows much larger pages when only keys are requested
+KEYS_PAGE_SIZE = 1000
+# Longer JQL is sent in a POST body to stay well clear of URL length limits
+MAX_GET_JQL_LENGTH = 2000
+
+AuthProvider = Callable[[], Optional[str]]
+
+
+def basic_auth_header(user: str, token: str) -> str:
+    creds = base64.b64encode(f"{user}:{token}".encode()).decode()
+    return f"Basic {creds}"
+
+
+def env_auth(email_var: str = "JIRA_EMAIL", token_var: str = "JIRA_API_TOKEN") -> AuthProvider:
+    """Auth provider reading the account email and API token from environment variables"""
+    def provider() -> Optional[str]:
+        email = os.environ.get(email_var, "")
+        token = os.environ.get(token_var, "")
+        if email and token:
+            return basic_auth_header(email, token)
+        return None
+    return provider
+
+
+def netrc_auth(host: str = JIRA_SITE) -> AuthProvider:
+    """Auth provider reading credentials for host from ~/.netrc"""
+    def provider() -> Optional[str]:
+        try:
+            import netrc
+            auth = netrc.netrc().authenticators(host)
+        except Exception:
+            return None
+        if auth:
+            return basic_auth_header(auth[0], auth[2])
+        return None
+    return provider
+
+
+def resolve_auth_header(providers: Sequence[AuthProvider]) -> Optional[str]:
+    """Return the Authorization header from the first provider that has credentials"""
+    for provider in providers:
+        header = provider()
+        if header:
+            return header
+    return None
+
+
+class JiraClient:
+    """Pooled Jira REST API v3 client"""
+
+    def __init__(self, auth_header: str, site: str = JIRA_SITE,
+                 timeout=DEFAULT_TIMEOUT, pool_size: int = DEFAULT_POOL_SIZE,
+                 scheduler: Optional[RequestScheduler] = None):
+        self.base_url = f"https://{site}"
+        self.api_base = f"{self.base_url}/rest/api/3"
+        self.timeout = timeout
+        self.scheduler = scheduler or RequestScheduler()
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": auth_header,
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+        })
+        self.session.mount("https://", RateLimitedAdapter(self.scheduler, pool_connections=1,
+                                                          pool_maxsize=pool_size))
+
+    def get(self, path: str, params: Optional[Dict] = None):
+        """GET an API path (relative to /rest/api/3) and return the decoded JSON body"""
+        response = self.session.get(f"{self.api_base}{path}", params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def post(self, path: str, body: Dict):
+        """POST a JSON body to an API path (relative to /rest/api/3) and return the decoded JSON body"""
+        response = self.session.post(f"{self.api_base}{path}", json=body, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def paginate(self, path: str, params: Optional[Dict] = None, body: Optional[Dict] = None,
+                 items_key: str = "issues") -> Iterator[Dict]:
+        """
+        Yield the items of every page of a nextPageToken-paginated endpoint.
+
+        Pass ``params`` for a GET request or ``body`` for a POST request.
+        """
+        next_token = None
+        while True:
+            if body is not None:
+                page_body = dict(body)
+                if next_token:
+                    page_body["nextPageToken"] = next_token
+                data = self.post(path, page_body)
+            else:
+                page_params = dict(params or {})
+                if next_token:
+                    page_params["nextPageToken"] = next_token
+                data = self.get(path, page_params)
+
+            yield from data.get(items_key, [])
+
+            if data.get("isLast", True):
+                break
+            next_token = data.get("nextPageToken")
+            if not next_token:
+                break
+
+    def search(self, jql: str, fields: str, page_size: int = SEARCH_PAGE_SIZE) -> List[Dict]:
+        """Return all issues matching a JQL query with the given comma-separated fields"""
+        if len(jql) > MAX_GET_JQL_LENGTH:
+            body = {"jql": jql, "fields": fields.split(","), "maxResults": page_size}
+            return list(self.paginate("/search/jql", body=body))
+        params = {"jql": jql, "fields": fields, "maxResults": page_size}
+        return list(self.paginate("/search/jql", params))
+
+    def search_keys(self, jql: str) -> List[str]:
+        """Return the keys of all issues matching a JQL query, in order (key-only search)"""
+        params = {"jql": jql, "fields": "key", "maxResults": KEYS_PAGE_SIZE}
+        return [issue["key"] for issue in self.paginate("/search/jql", params)]
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Local store of Jira search results for incremental syncs.
+
+The first sync of a JQL query pulls the full result set and records when it
+started. Later syncs only ask Jira for issues updated since then, merge them
+into the stored JSON, and reconcile deletions and moves with a cheap key-only
+query. Issue JSON is kept exactly as returned by /rest/api/3/search/jql.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from report_writer import atomic_write_text
+
+STORE_VERSION = 1
+# Jira compares `updated` at minute precision, so overlap syncs a little to avoid gaps
+SYNC_OVERLAP_MINUTES = 2
+
+ORDER_BY_PATTERN = re.compile(r'\s+ORDER\s+BY\s+', re.IGNORECASE)
+
+
+def split_order_by(jql: str):
+    """Split a JQL query into its filter and ORDER BY clause ('' when absent)"""
+    matches = list(ORDER_BY_PATTERN.finditer(jql))
+    if not matches:
+        return jql.strip(), ''
+    last = matches[-1]
+    return jql[:last.start()].strip(), jql[last.start():].strip()
+
+
+def restrict_jql(jql: str, clause: str) -> str:
+    """AND an extra clause onto a JQL query, keeping its ORDER BY at the end"""
+    condition, order_by = split_order_by(jql)
+    restricted = f'({condition}) AND {clause}'
+    return f'{restricted} {order_by}' if order_by else restricted
+
+
+class JiraIssueStore:
+    """Persisted search results and last-sync watermark for one JQL query and field list"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.synced_at: Optional[datetime] = None
+        self.issues: Dict[str, Dict] = {}
+        self.stats = {'mode': 'full', 'changed': 0, 'removed': 0, 'added': 0}
+        self._load()
+
+    @classmethod
+    def for_query(cls, store_dir: str, jql: str, fields: str) -> 'JiraIssueStore':
+        """Open the store for a JQL query and field list under store_dir"""
+        digest = hashlib.sha256(f'{jql}\n{fields}'.encode()).hexdigest()[:16]
+        return cls(os.path.join(store_dir, f'{digest}.json'))
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f'Warning: Ignoring unreadable Jira store {self.path}: {e}')
+            return
+        if data.get('version') != STORE_VERSION:
+            return
+        self.synced_at = datetime.fromisoformat(data['synced_at'])
+        self.issues = {issue['key']: issue for issue in data.get('issues', [])}
+
+    def save(self) -> None:
+        atomic_write_text(self.path, json.dumps({
+            'version': STORE_VERSION,
+            'synced_at': self.synced_at.isoformat(),
+            'issues': list(self.issues.values()),
+        }))
+
+    def updated_since_clause(self, now: datetime) -> str:
+        """
+        JQL clause selecting issues updated since the last sync.
+
+        The watermark is expressed as a relative offset ("-15m") rather than an
+        absolute timestamp, because Jira interprets absolute dates in the
+        account's profile timezone.
+        """
+        elapsed = (now - self.synced_at).total_seconds() / 60
+        minutes = max(1, math.ceil(elapsed)) + SYNC_OVERLAP_MINUTES
+        return f'updated >= "-{minutes}m"'
+
+    def sync(self, jql: str, search: Callable[[str], List[Dict]],
+             search_keys: Callable[[str], List[str]], incremental: bool = True) -> List[Dict]:
+        """
+        Bring the store up to date with Jira and return the issues in JQL order.
+
+        Args:
+            jql: The full query, including its ORDER BY clause
+            search: Runs a JQL query and returns full issue JSON
+            search_keys: Runs a JQL query and returns only the matching keys, in order
+            incremental: When False (or when nothing is stored yet) pull the full result set
+        """
+        started_at = datetime.now(timezone.utc)
+
+        if not incremental or self.synced_at is None:
+            self.issues = {issue['key']: issue for issue in search(jql)}
+            self.stats.update(mode='full', changed=len(self.issues))
+        else:
+            changed = search(restrict_jql(jql, self.updated_since_clause(started_at)))
+            for issue in changed:
+                self.issues[issue['key']] = issue
+
+            # Key-only pass: drops issues that were deleted or moved out of the query
+            # and gives the current ORDER BY position of everything that remains
+            current_keys = search_keys(jql)
+            current = set(current_keys)
+            removed = [key for key in self.issues if key not in current]
+            for key in removed:
+                del self.issues[key]
+
+            # Issues can enter the result set without their own `updated` moving
+            # (e.g. a renamed fix version), so fetch anything still unknown
+            missing = [key for key in current_keys if key not in self.issues]
+            if missing:
+                for issue in search(restrict_jql(jql, f'key in ({", ".join(missing)})')):
+                    self.issues[issue['key']] = issue
+
+            self.issues = {key: self.issues[key] for key in current_keys if key in self.issues}
+            self.stats.update(mode='incremental', changed=len(changed), removed=len(removed), added=len(missing))
+
+        self.synced_at = started_at
+        self.save()
+        return list(self.issues.values())
+
+    def summary(self) -> str:
+        """One-line description of the last sync"""
+        if self.stats['mode'] == 'full':
+            return f"full sync, {self.stats['changed']} issues stored"
+        return (f"incremental sync, {self.stats['changed']} changed, "
+                f"{self.stats['added']} added, {self.stats['removed']} removed, "
+                f"{len(self.issues)} issues stored")
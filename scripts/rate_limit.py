@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Rate-limit-aware request scheduling for the OADP report scripts.
+
+A RequestScheduler keeps one token bucket per API (host, plus the GitHub
+"search" and "graphql" resources, which have their own budgets). Requests are
+not paced until X-RateLimit-Remaining runs low; the bucket then spreads what
+is left until the reset. It waits for X-RateLimit-Reset when the budget is
+exhausted, and retries 429s, GitHub secondary rate limits
+and transient 5xx responses with jittered exponential backoff, honouring
+Retry-After when the server sends it.
+
+requests sessions use it by mounting a RateLimitedAdapter; urllib callers use
+RequestScheduler.urlopen.
+"""
+
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_RATE = None      # requests per second per API while the budget is healthy (None: unpaced)
+DEFAULT_BURST = 10
+MIN_RATE = 0.2
+LOW_BUDGET_FRACTION = 0.1
+MAX_RETRIES = 5
+BASE_DELAY = 1.0
+MAX_DELAY = 120.0
+# GitHub asks clients to wait at least a minute after a secondary rate limit without Retry-After
+SECONDARY_LIMIT_DELAY = 60.0
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+def api_key(url: str) -> str:
+    """Identify the rate-limit budget a URL draws from"""
+    parsed = urlparse(url)
+    host = parsed.hostname or ''
+    if host == 'api.github.com':
+        resource = parsed.path.strip('/').split('/', 1)[0]
+        if resource in ('search', 'graphql'):
+            return f'{host}/{resource}'
+    return host
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """X-RateLimit-Reset as epoch seconds (GitHub sends epoch seconds, Jira an ISO timestamp)"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After as a delay in seconds (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _Bucket:
+    """Token bucket plus the last rate-limit budget reported for one API"""
+
+    def __init__(self, rate: Optional[float], burst: int):
+        self.base_rate = rate
+        self.rate = rate  # None while unpaced
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0  # wall-clock time before which nothing may be sent
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.stats = {'requests': 0, 'retries': 0, 'throttled': 0, 'waited': 0.0}
+        # Threads currently sleeping on this API, and since when at least one has been
+        self.waiters = 0
+        self.wait_started = 0.0
+
+
+class RequestScheduler:
+    """Per-API token buckets that adapt to rate-limit headers, with retry/backoff policy"""
+
+    def __init__(self, rate: Optional[float] = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 max_retries: int = MAX_RETRIES, base_delay: float = BASE_DELAY,
+                 max_delay: float = MAX_DELAY):
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key: str) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.rate, self.burst)
+        return bucket
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to url may be sent"""
+        key = api_key(url)
+        while True:
+            with self._lock:
+                bucket = self._bucket(key)
+                wait = max(0.0, bucket.blocked_until - time.time())
+                if not wait:
+                    if bucket.rate is None:
+                        bucket.stats['requests'] += 1
+                        return
+                    now = time.monotonic()
+                    bucket.tokens = min(bucket.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+                    bucket.updated = now
+                    if bucket.tokens >= 1:
+                        bucket.tokens -= 1
+                        bucket.stats['requests'] += 1
+                        return
+                    wait = (1 - bucket.tokens) / bucket.rate
+            self.sleep(url, wait)
+
+    def sleep(self, url: str, seconds: float) -> None:
+        """Sleep on behalf of url's API, counting wall-clock time during which any thread waited"""
+        with self._lock:
+            bucket = self._bucket(api_key(url))
+            if not bucket.waiters:
+                bucket.wait_started = time.monotonic()
+            bucket.waiters += 1
+        try:
+            time.sleep(seconds)
+        finally:
+            with self._lock:
+                bucket.waiters -= 1
+                if not bucket.waiters:
+                    bucket.stats['waited'] += time.monotonic() - bucket.wait_started
+
+    def observe(self, url: str, status: int, headers) -> None:
+        """Update the API's budget and pace from a response's rate-limit headers"""
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+        with self._lock:
+            bucket = self._bucket(api_key(url))
+            try:
+                bucket.remaining = int(remaining)
+                if headers.get('X-RateLimit-Limit'):
+                    bucket.limit = int(headers['X-RateLimit-Limit'])
+            except ValueError:
+                return
+            bucket.reset_at = _parse_reset(headers.get('X-RateLimit-Reset'))
+
+            if bucket.remaining <= 0 and bucket.reset_at:
+                bucket.blocked_until = max(bucket.blocked_until, bucket.reset_at + 1)
+                return
+
+            # Plenty of budget: run at full speed. Running low: spread what is left until the reset
+            low_water = (bucket.limit or 0) * LOW_BUDGET_FRACTION
+            window = (bucket.reset_at - time.time()) if bucket.reset_at else None
+            if bucket.remaining > low_water or not window or window <= 0:
+                bucket.rate = bucket.base_rate
+                return
+            rate = max(MIN_RATE, bucket.remaining / window)
+            if bucket.base_rate is not None:
+                rate = min(bucket.base_rate, rate)
+            if bucket.rate is None:
+                # Start pacing from a single token rather than a full burst
+                bucket.tokens = 1.0
+                bucket.updated = time.monotonic()
+            bucket.rate = rate
+
+    def retry_delay(self, url: str, status: int, headers, attempt: int, body: str = '') -> Optional[float]:
+        """
+        Seconds to wait before retrying a response, or None when it should not be retried.
+
+        Also blocks the API's bucket for that long so concurrent workers back off together
+        instead of piling onto a throttled endpoint.
+        """
+        self.observe(url, status, headers)
+        primary_exhausted = headers.get('X-RateLimit-Remaining') == '0'
+        secondary = status == 403 and ('secondary rate limit' in body.lower() or 'Retry-After' in headers)
+        if attempt >= self.max_retries:
+            return None
+        if status not in RETRY_STATUSES and not (status == 403 and (primary_exhausted or secondary)):
+            return None
+
+        delay = _parse_retry_after(headers.get('Retry-After'))
+        if delay is None and primary_exhausted:
+            reset_at = _parse_reset(headers.get('X-RateLimit-Reset'))
+            if reset_at:
+                delay = max(0.0, reset_at - time.time()) + 1
+        if delay is None:
+            floor = SECONDARY_LIMIT_DELAY if secondary else 0.0
+            delay = max(floor, self.backoff(attempt))
+
+        with self._lock:
+            bucket = self._bucket(api_key(url))
+            bucket.stats['retries'] += 1
+            if status in (403, 429):
+                bucket.stats['throttled'] += 1
+            bucket.blocked_until = max(bucket.blocked_until, time.time() + delay)
+        return delay
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def urlopen(self, request: urllib.request.Request, timeout: float = 30) -> bytes:
+        """urllib.request.urlopen with scheduling and retries; returns the response body"""
+        url = request.full_url
+        attempt = 0
+        while True:
+            self.acquire(url)
+            try:
+                with urllib.request.urlopen(request, timeout=timeout) as resp:
+                    self.observe(url, resp.status, resp.headers)
+                    return resp.read()
+            except urllib.error.HTTPError as e:
+                body = e.read().decode('utf-8', 'replace') if e.code == 403 else ''
+                delay = self.retry_delay(url, e.code, e.headers, attempt, body)
+                if delay is None:
+                    raise
+            self.sleep(url, delay)
+            attempt += 1
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per-API counters: requests, retries, throttled, wall-clock seconds waited and last known budget"""
+        with self._lock:
+            return {
+                key: dict(bucket.stats, remaining=bucket.remaining,
+                          rate=None if bucket.rate is None else round(bucket.rate, 2))
+                for key, bucket in self._buckets.items()
+            }
+
+    def summary(self) -> str:
+        lines = []
+        for key, stats in sorted(self.stats().items()):
+            budget = f", {stats['remaining']} remaining" if stats['remaining'] is not None else ''
+            lines.append(f"  {key}: {stats['requests']} requests, {stats['retries']} retries, "
+                         f"{stats['throttled']} throttled, {stats['waited']:.1f}s waiting{budget}")
+        return '\n'.join(lines)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that paces requests through a RequestScheduler and retries throttled responses"""
+
+    def __init__(self, scheduler: RequestScheduler, **kwargs):
+        self.scheduler = scheduler
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        attempt = 0
+        while True:
+            self.scheduler.acquire(request.url)
+            try:
+                response = super().send(request, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if request.method != 'GET' or attempt >= self.scheduler.max_retries:
+                    raise
+                delay = self.scheduler.backoff(attempt)
+            else:
+                body = response.text if response.status_code == 403 else ''
+                delay = self.scheduler.retry_delay(request.url, response.status_code, response.headers,
+                                                   attempt, body)
+                if delay is None:
+                    return response
+                response.close()
+            self.scheduler.sleep(request.url, delay)
+            attempt += 1
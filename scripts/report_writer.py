@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Streaming, atomic writer for the generated markdown reports.
+
+Lines are written to a temporary file in the report's directory as the
+generators produce them, so a report never has to be held in memory as one
+string. The temporary file replaces the report only when the block exits
+cleanly; on any error it is removed and the previous report is left intact.
+atomic_write_text does the same for state and cache files written in one go.
+"""
+
+import os
+import tempfile
+from typing import Iterable
+
+
+class MarkdownWriter:
+    """
+    Context manager that streams report lines to ``path`` and publishes it atomically.
+
+    Lines are separated by newlines exactly like ``"\\n".join(lines)``; pass
+    ``trailing_newline=True`` to end the file with one as well.
+    """
+
+    def __init__(self, path: str, trailing_newline: bool = False):
+        self.path = path
+        self.trailing_newline = trailing_newline
+        self.lines_written = 0
+        self._file = None
+        self._tmp_path = None
+
+    def __enter__(self) -> "MarkdownWriter":
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(self.path)}.", suffix=".tmp",
+                                              dir=directory)
+        self._file = os.fdopen(fd, "w", encoding="utf-8")
+        return self
+
+    def write_line(self, line: str) -> None:
+        if self.lines_written:
+            self._file.write("\n")
+        self._file.write(line)
+        self.lines_written += 1
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.write_line(line)
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        try:
+            if exc_type is None:
+                if self.trailing_newline:
+                    self._file.write("\n")
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            self._file.close()
+            if exc_type is None:
+                # Keep the permissions an existing report had (mkstemp creates 0600 files)
+                try:
+                    os.chmod(self._tmp_path, os.stat(self.path).st_mode & 0o777)
+                except FileNotFoundError:
+                    os.chmod(self._tmp_path, 0o666 & ~_umask())
+                os.replace(self._tmp_path, self.path)
+                self._tmp_path = None
+        finally:
+            if self._tmp_path is not None:
+                try:
+                    os.unlink(self._tmp_path)
+                except OSError:
+                    pass
+        return False
+
+
+def atomic_write_text(path: str, text: str) -> None:
+    """Replace path with text atomically, through a uniquely named temporary file"""
+    with MarkdownWriter(path) as writer:
+        writer.write_line(text)
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask